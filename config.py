@@ -1,4 +1,5 @@
 import os
+import copy
 import json
 
 class Config:
@@ -17,19 +18,29 @@ class Config:
     
     CONFIG_FILE = "config.json"
     
+    # (path, modification time, configuration) of the file last read or written
+    _cache = None
+    
     @classmethod
     def load_config(cls):
-        """Load configuration from file or create default if not exists."""
+        """Load configuration from file or create default if not exists.
+        
+        The file is parsed again only after it changed; callers get a copy
+        they are free to modify.
+        """
         try:
             if os.path.exists(cls.CONFIG_FILE):
-                with open(cls.CONFIG_FILE, 'r') as f:
-                    return json.load(f)
+                mtime = os.stat(cls.CONFIG_FILE).st_mtime_ns
+                if cls._cache is None or cls._cache[:2] != (cls.CONFIG_FILE, mtime):
+                    with open(cls.CONFIG_FILE, 'r') as f:
+                        cls._cache = (cls.CONFIG_FILE, mtime, json.load(f))
+                return copy.deepcopy(cls._cache[2])
             else:
                 cls.save_config(cls.DEFAULT_CONFIG)
-                return cls.DEFAULT_CONFIG
+                return copy.deepcopy(cls.DEFAULT_CONFIG)
         except Exception as e:
             print(f"Error loading config: {e}")
-            return cls.DEFAULT_CONFIG
+            return copy.deepcopy(cls.DEFAULT_CONFIG)
     
     @classmethod
     def save_config(cls, config):
@@ -37,6 +48,7 @@ class Config:
         try:
             with open(cls.CONFIG_FILE, 'w') as f:
                 json.dump(config, f, indent=4)
+            cls._cache = (cls.CONFIG_FILE, os.stat(cls.CONFIG_FILE).st_mtime_ns, copy.deepcopy(config))
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
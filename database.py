@@ -1,5 +1,7 @@
 import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from models import Patient, Program, Task, User, SharedAccess, AuditLog
 from security import hash_password, get_client_ip
 from datetime import datetime, timedelta
@@ -15,6 +17,13 @@ except ImportError:
 class Database:
     """Database handler for the Medical Patient Manager application."""
     
+    # Kanban columns of a new program; copy before handing them out
+    DEFAULT_KANBAN_COLUMNS = (
+        {"id": "todo", "title": "To Do"},
+        {"id": "in_progress", "title": "In Progress"},
+        {"id": "done", "title": "Done"},
+    )
+    
     def __init__(self, db_file=None):
         """Initialize database connection and create tables if they don't exist."""
         # Load configuration
@@ -28,8 +37,12 @@ class Database:
             self.db_file = self.config.get("db_file", "patient_manager.db")
         
         self.conn = None
+        self.conn_thread_id = None  # Thread that opened self.conn
         self.api_client = None
         
+        # Nesting depth of transaction() blocks
+        self._transaction_depth = 0
+        
         if self.mode == "local":
             self._connect()
             self._create_tables()
@@ -55,12 +68,67 @@ class Database:
                 
             self.conn = sqlite3.connect(self.db_file)
             self.conn.row_factory = sqlite3.Row
+            self.conn_thread_id = threading.get_ident()
             return True
         except sqlite3.Error as e:
             print(f"Database connection error: {e}")
             self.conn = None
             return False
     
+    @contextmanager
+    def _read_connection(self):
+        """Yield a connection for reads from the calling thread.
+        
+        SQLite connections belong to the thread that opened them, so reads
+        from other threads use a connection of their own for the block.
+        """
+        if threading.get_ident() == self.conn_thread_id:
+            yield self.conn
+            return
+        
+        conn = sqlite3.connect(self.db_file)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
+    @contextmanager
+    def transaction(self):
+        """Run several writes as one transaction with a single commit.
+        
+        Writers that support it (save_program_kanban_config,
+        move_orphaned_tasks and update_task_status) leave committing to the
+        block. Inside a block, save_program_kanban_config and
+        move_orphaned_tasks raise database errors rather than returning
+        their failure value (False and None). update_task_status still
+        returns a (success, details) tuple for a missing task or a version
+        conflict; its database errors always propagate.
+        
+        The block commits when it exits and rolls back if it raises. Only
+        the outermost of nested blocks commits. In remote mode this does
+        nothing.
+        """
+        if self.mode == "remote":
+            yield
+            return
+        
+        if not self.conn:
+            self._connect()
+        
+        self._transaction_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._transaction_depth -= 1
+            if self._transaction_depth == 0:
+                self.conn.rollback()
+            raise
+        
+        self._transaction_depth -= 1
+        if self._transaction_depth == 0:
+            self.conn.commit()
+    
     def check_connection(self):
         """Ensure the database connection is active and reconnect if necessary."""
         if self.mode != "local":
@@ -158,6 +226,12 @@ class Database:
             # Check if patient_id column exists in tasks table and add it if not
             self._ensure_column_exists('tasks', 'patient_id', 'INTEGER')
             
+            # Index matching the filter and ordering of get_tasks_by_program
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_prog_status_pos "
+                "ON tasks (program_id, status, order_index, created_at)"
+            )
+            
             # Create audit_log table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS audit_log (
@@ -920,11 +994,7 @@ class Database:
                 if 'program' in response and 'id' in response['program']:
                     program_id = response['program']['id']
                     # Set default kanban columns for the new program
-                    default_columns = [
-                        {"id": "todo", "title": "To Do"},
-                        {"id": "in_progress", "title": "In Progress"},
-                        {"id": "done", "title": "Done"}
-                    ]
+                    default_columns = [dict(column) for column in self.DEFAULT_KANBAN_COLUMNS]
                     self.save_program_kanban_config(program_id, default_columns)
                     return program_id
                 
@@ -945,11 +1015,7 @@ class Database:
             program_id = cursor.lastrowid
             
             # Set default kanban columns for the new program
-            default_columns = [
-                {"id": "todo", "title": "To Do"},
-                {"id": "in_progress", "title": "In Progress"},
-                {"id": "done", "title": "Done"}
-            ]
+            default_columns = [dict(column) for column in self.DEFAULT_KANBAN_COLUMNS]
             self.save_program_kanban_config(program_id, default_columns)
             
             return program_id
@@ -1156,12 +1222,16 @@ class Database:
         task_id = cursor.lastrowid
         self.conn.commit()
         
-        # Return the task with its new ID
+        # Return the task with its new ID and position
         task.id = task_id
+        task.order_index = next_order
         return task
     
     def get_tasks_by_program(self, program_id):
-        """Get all tasks for a specific program."""
+        """Get all tasks for a specific program.
+        
+        Unlike the other methods this may be called from any thread.
+        """
         # In remote mode, use API client
         if self.mode == "remote":
             try:
@@ -1194,15 +1264,14 @@ class Database:
                 print(f"Error getting tasks from API: {e}")
                 return []
                 
-        # In local mode, use database
+        # In local mode, use database; this may run on a worker thread
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT * FROM tasks 
-                WHERE program_id = ? 
-                ORDER BY status, order_index, created_at
-            """, (program_id,))
-            rows = cursor.fetchall()
+            with self._read_connection() as conn:
+                rows = conn.execute("""
+                    SELECT * FROM tasks 
+                    WHERE program_id = ? 
+                    ORDER BY status, order_index, created_at
+                """, (program_id,)).fetchall()
             return [Task(
                 id=row['id'],
                 name=row['name'],
@@ -1221,6 +1290,41 @@ class Database:
             print(f"Error getting tasks: {e}")
             return []
     
+    def get_program_board_revision(self, program_id):
+        """Get a cheap fingerprint of a program's tasks.
+        
+        The fingerprint changes whenever a task of the program is added,
+        deleted or updated, since every update bumps the task's version.
+        
+        Returns:
+            A (task count, version total, highest task ID) tuple, or None if
+            it cannot be determined (e.g. the server does not provide it)
+        """
+        # In remote mode, ask the server instead of fetching every task
+        if self.mode == "remote":
+            try:
+                response = self.api_client.get("tasks/revision", params={"program_id": program_id})
+                revision = response.get('revision')
+                if isinstance(revision, list) and len(revision) == 3:
+                    return tuple(revision)
+                print(f"Error: Unexpected response format from API for tasks revision: {response}")
+                return None
+            except Exception as e:
+                print(f"Error getting board revision from API: {e}")
+                return None
+        
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                SELECT COUNT(*), COALESCE(SUM(version), 0), COALESCE(MAX(id), 0)
+                FROM tasks
+                WHERE program_id = ?
+            """, (program_id,))
+            return tuple(cursor.fetchone())
+        except sqlite3.Error as e:
+            print(f"Error getting board revision: {e}")
+            return None
+    
     def get_task_by_id(self, task_id):
         """Get a task by its ID."""
         # In remote mode, use API client
@@ -1378,13 +1482,61 @@ class Database:
             (new_status, new_version, now, task_id)
         )
         
-        self.conn.commit()
+        if not self._transaction_depth:
+            self.conn.commit()
         
         # Return the updated task
         cursor.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
         updated_task = self._create_task_from_row(cursor.fetchone())
         return (True, {"updated_task": updated_task})
     
+    def move_orphaned_tasks(self, program_id, column_ids, new_status):
+        """Move a program's tasks whose status is not a column to a new status.
+        
+        All such tasks are moved with a single statement.
+        
+        Args:
+            program_id: ID of the program the tasks belong to
+            column_ids: IDs of the program's columns
+            new_status: New status for the tasks
+            
+        Returns:
+            The number of tasks moved, or None if the update failed. In
+            remote mode no tasks are moved and this returns 0.
+        """
+        # The server has no bulk update for tasks; boards show orphaned
+        # tasks in their first column until they are moved
+        if self.mode == "remote":
+            return 0
+        
+        column_ids = list(column_ids)
+        try:
+            # Check connection and reconnect if needed
+            if not self.conn:
+                success = self._connect()
+                if not success:
+                    print("Failed to connect to the database")
+                    return None
+                
+            placeholders = ", ".join("?" * len(column_ids))
+            cursor = self.conn.cursor()
+            cursor.execute(
+                f"""UPDATE tasks 
+                    SET status = ?, version = version + 1, modified_at = ?
+                    WHERE program_id = ? AND status NOT IN ({placeholders})""",
+                (new_status, datetime.now().isoformat(), program_id, *column_ids)
+            )
+            
+            if not self._transaction_depth:
+                self.conn.commit()
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            if self._transaction_depth:
+                raise
+            self.conn.rollback()
+            print(f"Error moving orphaned tasks: {e}")
+            return None
+    
     def update_task_order(self, task_id, new_order_index):
         """Update only the order of a task."""
         try:
@@ -1438,9 +1590,9 @@ class Database:
                 "error": "Conflict detected: This task has been modified by another user."
             })
         
-        # Get all tasks in the same column
+        # Get all tasks in the same column, in the order get_tasks_by_program shows them
         cursor.execute(
-            "SELECT id, order_index FROM tasks WHERE program_id = ? AND status = ? ORDER BY order_index",
+            "SELECT id, order_index FROM tasks WHERE program_id = ? AND status = ? ORDER BY order_index, created_at",
             (task.program_id, task.status)
         )
         tasks = cursor.fetchall()
@@ -2221,11 +2373,10 @@ class Database:
                 return json.loads(result[0])
             else:
                 # Return the default configuration if no program-specific config exists
-                return self.config.get("kanban_columns", [
-                    {"id": "todo", "title": "To Do"},
-                    {"id": "in_progress", "title": "In Progress"},
-                    {"id": "done", "title": "Done"}
-                ])
+                kanban_columns = self.config.get("kanban_columns")
+                if kanban_columns is None:
+                    kanban_columns = [dict(column) for column in self.DEFAULT_KANBAN_COLUMNS]
+                return kanban_columns
         except sqlite3.Error as e:
             print(f"Error getting program kanban config: {e}")
             return None
@@ -2279,9 +2430,12 @@ class Database:
                     (program_id, config_json)
                 )
             
-            self.conn.commit()
+            if not self._transaction_depth:
+                self.conn.commit()
             return True
         except sqlite3.Error as e:
+            if self._transaction_depth:
+                raise
             print(f"Error saving program kanban config: {e}")
             return False
 
@@ -2,27 +2,421 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QScrollArea, QFrame, QInputDialog,
                              QTextEdit, QDialog, QLineEdit, QFormLayout, QMessageBox,
                              QTabWidget, QApplication, QDialogButtonBox, QComboBox, QSpinBox,
-                             QColorDialog, QSizePolicy, QToolButton)
-from PyQt5.QtCore import Qt, QMimeData, pyqtSignal, QPoint, QTimer, QSettings, QSize
-from PyQt5.QtGui import QDrag, QFont, QPixmap, QCursor, QColor, QPainter, QPen
+                             QColorDialog, QSizePolicy, QSpacerItem, QToolButton, QStyle, QStyleOption)
+from PyQt5.QtCore import (Qt, QMimeData, pyqtSignal, pyqtSlot, QPoint, QRect, QRectF, QTimer, QSettings, QSize, QByteArray,
+                          QObject, QRunnable, QThreadPool, QEvent)
+from PyQt5.QtGui import QBrush, QDrag, QFont, QImage, QPixmap, QPixmapCache, QCursor, QColor, QPainter, QPen
 import copy
+import logging
+from contextlib import contextmanager
+from functools import lru_cache
 
 from models import Task, Program
 
+logger = logging.getLogger(__name__)
+
+
+# Fonts shared by all task cards, columns and board headers
+_TASK_NAME_FONT = QFont("Segoe UI", 11, QFont.Bold)
+_TASK_PRIORITY_FONT = QFont("Segoe UI", 10)
+_TASK_PRIORITY_FONT_BOLD = QFont("Segoe UI", 10, QFont.Bold)
+_TASK_DESCRIPTION_FONT = QFont("Segoe UI", 9)
+_TASK_BUTTON_FONT = QFont("Segoe UI", 8)
+_COLUMN_HANDLE_FONT = QFont("Segoe UI", 12)
+_COLUMN_TITLE_FONT = QFont("Segoe UI", 11, QFont.Bold)
+_COLUMN_ADD_BUTTON_FONT = QFont("Segoe UI", 12, QFont.Bold)
+_BOARD_TITLE_FONT = QFont("Segoe UI", 16, QFont.Bold)
+_BOARD_PATIENT_FONT = QFont("Segoe UI", 12)
+_BOARD_BUTTON_FONT = QFont("Segoe UI", 10)
+_PROGRAM_NAME_INPUT_FONT = QFont("Segoe UI", 11)
+
+# Background of the board area holding the columns
+_COLUMNS_AREA_COLOR = "#f0f2f5"
+_COLUMNS_AREA_BRUSH = QBrush(QColor(_COLUMNS_AREA_COLOR))
+
+# Light border shared by the painted widgets on a column
+_WIDGET_BORDER_PEN = QPen(QColor("#d0d0d0"), 1)
+
+# Look shared by the board's dialogs
+_DIALOG_STYLESHEET = """
+    QDialog {
+        background-color: #f8f9fb;
+    }
+    QLabel {
+        font-family: 'Segoe UI';
+        font-size: 11pt;
+        color: #2c3e50;
+    }
+    QLineEdit, QTextEdit, QComboBox, QSpinBox {
+        border: 1px solid #dcdfe6;
+        border-radius: 4px;
+        padding: 8px;
+        background-color: white;
+        font-family: 'Segoe UI';
+        font-size: 10pt;
+        color: #2c3e50;
+        selection-background-color: #3498db;
+    }
+    QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+        border-color: #3498db;
+    }
+    QComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left-width: 0px;
+        border-top-right-radius: 4px;
+        border-bottom-right-radius: 4px;
+    }
+"""
+
+# Bright blue line showing where a dragged column would be dropped
+_DROP_INDICATOR_PEN = QPen(QColor("#2980b9"), 4)
+_DROP_INDICATOR_PEN.setCapStyle(Qt.FlatCap)
+
+
+@lru_cache(maxsize=256)
+def _darkenColor(hex_color, factor):
+    """Darken a hex color by a factor; boards use few colors, so results are kept."""
+    # Remove # if present
+    hex_color = hex_color.lstrip('#')
+    
+    # Convert to RGB
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    
+    # Darken
+    r = max(0, int(r * (1 - factor)))
+    g = max(0, int(g * (1 - factor)))
+    b = max(0, int(b * (1 - factor)))
+    
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+@contextmanager
+def _updatesSuspended(*widgets):
+    """Paint widgets once, when the block ends, however much it changes them.
+    
+    Blocks nest: a widget whose updates are already off (directly or
+    through an ancestor) is left for the outer block to turn back on.
+    """
+    suspended = [widget for widget in widgets if widget.updatesEnabled()]
+    for widget in suspended:
+        widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        for widget in suspended:
+            widget.setUpdatesEnabled(True)
+
+
+def _cachedPixmap(key, size, ratio, draw):
+    """Return a transparent pixmap of a size drawn by draw(painter, rect).
+    
+    Pixmaps are shared through QPixmapCache under key, size and pixel
+    ratio, so widgets showing the same glyph draw it only once.
+    """
+    key = f"{key}_{size.width()}x{size.height()}@{ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(size * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        draw(painter, QRectF(0, 0, size.width(), size.height()))
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _renderDragPixmap(widget, scale=1.0):
+    """Render widget, scaled, into a transparent pixmap for a drag image.
+    
+    The widget is drawn into an ARGB32_Premultiplied image, the format
+    Qt's raster engine blends fastest, at the screen's pixel ratio so the
+    drag image is sharp and rounded corners stay clear.
+    """
+    ratio = widget.devicePixelRatioF()
+    image = QImage(widget.size() * scale * ratio, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(ratio)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    painter.scale(scale, scale)
+    widget.render(painter)
+    painter.end()
+    return QPixmap.fromImage(image)
+
+
+class _PriorityBadge(QWidget):
+    """The colored priority badge of a task card, drawn from a cached pixmap."""
+    
+    MARGIN = 3  # Space above and below the badge
+    PADDING = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(36)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        self.setFont(_TASK_PRIORITY_FONT_BOLD)
+        self._text = ""
+        self._color = None
+    
+    def setBadge(self, text, color):
+        """Show text on a badge of the given color."""
+        if (text, color) != (self._text, self._color):
+            text_changed = text != self._text
+            self._text, self._color = text, color
+            if text_changed:
+                self.updateGeometry()
+            self.update()
+    
+    def text(self):
+        return self._text
+    
+    def minimumSizeHint(self):
+        width = self.fontMetrics().horizontalAdvance(self._text) + 2 * self.PADDING
+        return QSize(width, self.height())
+    
+    def sizeHint(self):
+        return self.minimumSizeHint()
+    
+    def paintEvent(self, event):
+        if self._color is None:
+            return
+        size = QSize(self.width(), self.height() - 2 * self.MARGIN)
+        
+        def draw(painter, rect):
+            # Bordered like the other widgets on the column
+            painter.setPen(_WIDGET_BORDER_PEN)
+            painter.setBrush(QColor(self._color))
+            painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 5, 5)
+            painter.setFont(self.font())
+            painter.setPen(Qt.white)
+            painter.drawText(rect.adjusted(self.PADDING, self.PADDING, -self.PADDING, -self.PADDING),
+                             Qt.AlignCenter, self._text)
+        
+        pixmap = _cachedPixmap(f"priority_badge_{self._color}_{self._text}", size,
+                               self.devicePixelRatioF(), draw)
+        QPainter(self).drawPixmap(0, self.MARGIN, pixmap)
+
+
+class _ColumnDragHandle(QWidget):
+    """The "☰" drag handle of a column header, drawn from a cached pixmap."""
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(24, 24)
+        self.setFont(_COLUMN_HANDLE_FONT)
+        self.setAttribute(Qt.WA_Hover)  # Repaint when hovered
+        self._color = "#ffffff"  # Column color behind the glyph
+    
+    def setColor(self, color):
+        """Set the color of the column the handle sits on."""
+        if color != self._color:
+            self._color = color
+            self.update()
+    
+    def paintEvent(self, event):
+        hovered = self.underMouse()
+        
+        def draw(painter, rect):
+            # A darker rounded square, with the column color and a border inset
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 26 if hovered else 13))
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(_WIDGET_BORDER_PEN)
+            painter.setBrush(QColor(self._color))
+            painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+            painter.setFont(self.font())
+            painter.setPen(QColor("#555"))
+            painter.drawText(rect, Qt.AlignCenter, "☰")
+        
+        pixmap = _cachedPixmap(f"column_handle_{self._color}_{hovered}", self.size(),
+                               self.devicePixelRatioF(), draw)
+        QPainter(self).drawPixmap(0, 0, pixmap)
+
+
+class _TasksContainer(QWidget):
+    """The scrolled widget holding a column's task cards.
+    
+    It paints all of its pixels, including the corners its rounded
+    stylesheet border leaves out, so Qt can scroll it by moving what is
+    already on screen and only paint the newly exposed strip.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+    
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.StyleChange:
+            # Style sheets with a border or rounded corners turn this off
+            self.setAttribute(Qt.WA_OpaquePaintEvent)
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        # Columns paint no background, so the board shows around the corners
+        painter.fillRect(event.rect(), _COLUMNS_AREA_BRUSH)
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+
+
+class _TasksFetcherSignals(QObject):
+    """Signals of a _TasksFetcher, which as a QRunnable cannot have its own."""
+    finished = pyqtSignal(int, object)  # Cache generation, list of tasks
+
+
+class _TasksFetcher(QRunnable):
+    """Fetch a program's tasks on a QThreadPool thread."""
+    
+    def __init__(self, db, program_id, generation):
+        super().__init__()
+        self.db = db
+        self.program_id = program_id
+        self.generation = generation
+        self.signals = _TasksFetcherSignals()
+    
+    def run(self):
+        self.signals.finished.emit(self.generation, self.db.get_tasks_by_program(self.program_id))
+
+
+class _TaskActionBar(QWidget):
+    """The Edit and Delete buttons of a task card, painted by one widget.
+    
+    A card would otherwise need two styled QPushButtons; this draws the
+    same buttons, with hover and pressed colors, and reports clicks.
+    """
+    editClicked = pyqtSignal()
+    deleteClicked = pyqtSignal()
+    
+    BUTTON_SIZE = QSize(60, 28)
+    BUTTON_SPACING = 8
+    
+    # Label and normal, hover and pressed colors of each button
+    BUTTONS = (
+        ("Edit", QColor("#3498db"), QColor("#2980b9"), QColor("#1c5b8c")),
+        ("Delete", QColor("#e74c3c"), QColor("#c0392b"), QColor("#922b21")),
+    )
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        width = len(self.BUTTONS) * (self.BUTTON_SIZE.width() + self.BUTTON_SPACING) - self.BUTTON_SPACING
+        self.setFixedSize(width, self.BUTTON_SIZE.height())
+        self.setMouseTracking(True)  # For hover colors
+        self._rects = [QRect(QPoint(i * (self.BUTTON_SIZE.width() + self.BUTTON_SPACING), 0), self.BUTTON_SIZE)
+                       for i in range(len(self.BUTTONS))]
+        self._hovered = None  # Index of the button under the mouse
+        self._pressed = None  # Index of the button being pressed
+    
+    def _buttonAt(self, pos):
+        """Return the index of the button at a position, or None."""
+        for index, rect in enumerate(self._rects):
+            if rect.contains(pos):
+                return index
+        return None
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(_TASK_BUTTON_FONT)
+        for index, (rect, (label, color, hover_color, pressed_color)) in enumerate(zip(self._rects, self.BUTTONS)):
+            if index == self._pressed and index == self._hovered:
+                color = pressed_color
+            elif index == self._hovered:
+                color = hover_color
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 4, 4)
+            painter.setPen(Qt.white)
+            painter.drawText(rect, Qt.AlignCenter, label)
+    
+    def mouseMoveEvent(self, event):
+        hovered = self._buttonAt(event.pos())
+        if hovered != self._hovered:
+            self._hovered = hovered
+            self.update()
+        if self._pressed is None:
+            # Let the card start a drag from the gap between the buttons
+            event.ignore()
+    
+    def leaveEvent(self, event):
+        self._hovered = None
+        self.update()
+        super().leaveEvent(event)
+    
+    def mousePressEvent(self, event):
+        self._pressed = self._buttonAt(event.pos()) if event.button() == Qt.LeftButton else None
+        if self._pressed is None:
+            event.ignore()
+            return
+        self.update()
+    
+    def mouseReleaseEvent(self, event):
+        pressed, self._pressed = self._pressed, None
+        if pressed is None:
+            event.ignore()
+            return
+        self.update()
+        if self._buttonAt(event.pos()) == pressed:
+            (self.editClicked, self.deleteClicked)[pressed].emit()
+
 
 class TaskWidget(QFrame):
     """Widget representing a task in the kanban board."""
     
-    doubleClicked = pyqtSignal(object)  # Signal when the task is double-clicked
     moveTask = pyqtSignal(int, str)  # Signal to move a task (task_id, new_status)
-    edit_clicked = pyqtSignal(object)  # Signal when edit button is clicked
-    delete_clicked = pyqtSignal(object)  # Signal when delete button is clicked
+
+    PRIORITIES = ("High", "Medium", "Low")
     
-    def __init__(self, task, parent=None):
+    # Badge color of each priority, matching the card borders in STYLESHEET
+    PRIORITY_COLORS = {"High": "#e74c3c", "Medium": "#f39c12", "Low": "#2ecc71"}
+    
+    # MIME type of dragged tasks; the data is the task ID as ASCII digits
+    MIME_TYPE = "application/x-task-id"
+    
+    MIN_HEIGHT = 100
+
+    # Shared by every task card; installed once per column on its tasks container so
+    # Qt parses it once instead of once per card. Priority colors are chosen
+    # through the "priority" dynamic property: High red, Medium orange, Low green.
+    STYLESHEET = """
+        QFrame#TaskCard {
+            background-color: #ffffff;
+            border: 1px solid #d0d0d0;
+            border-left: 6px solid #f39c12;
+            border-radius: 6px;
+            padding: 8px;
+            margin: 4px;
+        }
+        QFrame#TaskCard[priority="High"] {
+            border-left: 6px solid #e74c3c;
+        }
+        QFrame#TaskCard[priority="Low"] {
+            border-left: 6px solid #2ecc71;
+        }
+        QFrame#TaskCard QLabel#taskName {
+            color: #2c3e50;
+        }
+        QFrame#TaskCard QLabel#taskDescription {
+            color: #34495e;
+            margin-top: 4px;
+        }
+    """
+    
+    def __init__(self, task, board, parent=None):
         super().__init__(parent)
+        self.board = board  # The KanbanBoard handling this task's actions
         self.task = task
         self.task_version = task.version  # Store the current task version
+        self.column = None  # The KanbanColumn showing this card, if any
+        self._task_color = None  # Custom card color, None for the default white
         
+        self.setObjectName("TaskCard")
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Raised)
         self.setLineWidth(1)
@@ -34,128 +428,87 @@ class TaskWidget(QFrame):
         self.setAcceptDrops(True)  # Enable drops for vertical reordering
         
         # Set fixed height
-        self.setMinimumHeight(100)
+        self.setMinimumHeight(self.MIN_HEIGHT)
         self.setMaximumHeight(200)
         self.setMinimumWidth(180)
         
-        # Set style with task color and a priority border color
-        priority_colors = {
-            "High": "#e74c3c",   # Red for high priority
-            "Medium": "#f39c12", # Orange for medium priority
-            "Low": "#2ecc71"     # Green for low priority
-        }
-        
-        priority_color = priority_colors.get(task.priority, priority_colors["Medium"])
-        task_color = task.color if hasattr(task, 'color') and task.color else "#ffffff"
-        
-        self.setStyleSheet(f"""
-            TaskWidget {{
-                background-color: {task_color};
-                border: 1px solid #d0d0d0;
-                border-left: 6px solid {priority_color};
-                border-radius: 6px;
-                padding: 8px;
-                margin: 4px;
-            }}
-        """)
-        
         # Create layout
         layout = QVBoxLayout()
         layout.setContentsMargins(8, 8, 8, 8)
         layout.setSpacing(8)
         self.setLayout(layout)
         
-        # Task name (first line, bold)
-        self.name_label = QLabel(task.name)
+        # Task name (first line, bold); task text is shown as entered, which
+        # also spares QLabel from checking it for rich text on every update
+        self.name_label = QLabel()
+        self.name_label.setTextFormat(Qt.PlainText)
         self.name_label.setWordWrap(True)
-        self.name_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.name_label.setStyleSheet("color: #2c3e50;")
+        self.name_label.setObjectName("taskName")
+        self.name_label.setFont(_TASK_NAME_FONT)
         layout.addWidget(self.name_label)
         
-        # Priority indicator - simplified approach with direct styling
-        priority_text = task.priority + " Priority"
-        priority_label = QLabel(priority_text)
-        priority_label.setFixedHeight(36)
-        priority_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        priority_label.setFont(QFont("Segoe UI", 10))
-        priority_label.setAlignment(Qt.AlignCenter)
-        priority_label.setStyleSheet(f"""
-            background-color: {priority_color};
-            color: white;
-            border-radius: 5px;
-            padding: 4px;
-            margin: 3px 0px;
-            font-weight: bold;
-        """)
-        layout.addWidget(priority_label)
+        # Priority indicator
+        self.priority_label = _PriorityBadge()
+        layout.addWidget(self.priority_label)
         
-        # Description (additional lines if available)
-        if task.description:
-            desc_text = task.description
-            if len(desc_text) > 100:
-                desc_text = desc_text[:97] + "..."
-                
-            self.desc_label = QLabel(desc_text)
-            self.desc_label.setWordWrap(True)
-            self.desc_label.setFont(QFont("Segoe UI", 9))
-            self.desc_label.setStyleSheet("color: #34495e; margin-top: 4px;")
-            layout.addWidget(self.desc_label)
+        # Description (additional lines if available); created by updateFrom
+        # for the first description shown, so most cards need no such label
+        self.desc_label = None
         
         # Add spacing before buttons
         layout.addSpacing(5)
         
-        # Task actions
-        action_layout = QHBoxLayout()
-        action_layout.setSpacing(8)
-        
-        # Edit button
-        edit_btn = QPushButton("Edit")
-        edit_btn.setFixedSize(60, 28)
-        edit_btn.setFont(QFont("Segoe UI", 8))
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1c5b8c;
-            }
-        """)
-        edit_btn.clicked.connect(self._on_edit_clicked)
-        action_layout.addWidget(edit_btn)
-        
-        # Delete button
-        delete_btn = QPushButton("Delete")
-        delete_btn.setFixedSize(60, 28)
-        delete_btn.setFont(QFont("Segoe UI", 8))
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 4px 8px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #922b21;
-            }
-        """)
-        delete_btn.clicked.connect(self._on_delete_clicked)
-        action_layout.addWidget(delete_btn)
-        
-        action_layout.addStretch()
+        # Task actions (Edit and Delete buttons)
+        action_bar = _TaskActionBar(self)
+        action_bar.editClicked.connect(self._on_edit_clicked)
+        action_bar.deleteClicked.connect(self._on_delete_clicked)
+        layout.addWidget(action_bar, 0, Qt.AlignLeft)
         
-        layout.addLayout(action_layout)
-    
+        # Fill in the task last, so a custom color's stylesheet is applied
+        # to the finished card in one pass
+        self.updateFrom(task)
+
+    def updateFrom(self, task):
+        """Update the widget in place to show the given task."""
+        self.task = task
+        self.task_version = task.version
+
+        # The shared STYLESHEET picks the border color from this property;
+        # only a custom task color needs a stylesheet of its own.
+        priority = task.priority if task.priority in self.PRIORITIES else "Medium"
+        if self.property("priority") != priority:
+            self.setProperty("priority", priority)
+            self.style().unpolish(self)
+            self.style().polish(self)
+
+        # Setting a stylesheet restyles the whole card, so only do it when
+        # the color changed
+        task_color = task.color if hasattr(task, 'color') and task.color else "#ffffff"
+        if task_color.lower() == "#ffffff":
+            task_color = None
+        if task_color != self._task_color:
+            self._task_color = task_color
+            self.setStyleSheet(
+                f"QFrame#TaskCard {{ background-color: {task_color}; }}" if task_color else "")
+
+        self.name_label.setText(task.name)
+        self.priority_label.setBadge(task.priority + " Priority", self.PRIORITY_COLORS[priority])
+
+        desc_text = task.description or ""
+        if len(desc_text) > 100:
+            desc_text = desc_text[:97] + "..."
+        if desc_text and self.desc_label is None:
+            self.desc_label = QLabel()
+            self.desc_label.setTextFormat(Qt.PlainText)
+            self.desc_label.setWordWrap(True)
+            self.desc_label.setObjectName("taskDescription")
+            self.desc_label.setFont(_TASK_DESCRIPTION_FONT)
+            layout = self.layout()
+            layout.insertWidget(layout.indexOf(self.priority_label) + 1, self.desc_label)
+        if self.desc_label is not None:
+            self.desc_label.setText(desc_text)
+            self.desc_label.setVisible(bool(desc_text))
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.drag_start_position = event.pos()
@@ -170,14 +523,19 @@ class TaskWidget(QFrame):
         drag = QDrag(self)
         mime_data = QMimeData()
         
-        # Include both task ID and type of drag
-        task_data = f"{self.task.id}:task"
-        mime_data.setText(task_data)
+        # The MIME type marks this as a task drag
+        mime_data.setData(self.MIME_TYPE, QByteArray.number(self.task.id))
         drag.setMimeData(mime_data)
         
-        # Create a pixmap of the task for drag visualization
-        pixmap = QPixmap(self.size())
-        self.render(pixmap)
+        # Create a pixmap of the task for drag visualization. It is shared
+        # through QPixmapCache, so an edit (new version) or resize renders
+        # a fresh one and rebuilt cards reuse the old one.
+        ratio = self.devicePixelRatioF()
+        key = f"task_drag_{self.task.id}_{self.task_version}_{self.width()}x{self.height()}@{ratio}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = _renderDragPixmap(self)
+            QPixmapCache.insert(key, pixmap)
         drag.setPixmap(pixmap)
         drag.setHotSpot(event.pos())
         
@@ -185,55 +543,44 @@ class TaskWidget(QFrame):
         drag.exec_(Qt.MoveAction)
     
     def dragEnterEvent(self, event):
-        mime_data = event.mimeData()
-        if mime_data.hasText() and ":task" in mime_data.text():
+        if event.mimeData().hasFormat(self.MIME_TYPE):
             event.acceptProposedAction()
     
     def dragMoveEvent(self, event):
-        mime_data = event.mimeData()
-        if mime_data.hasText() and ":task" in mime_data.text():
+        if event.mimeData().hasFormat(self.MIME_TYPE):
             event.acceptProposedAction()
     
     def dropEvent(self, event):
         mime_data = event.mimeData()
-        if mime_data.hasText():
-            text = mime_data.text()
-            if ":task" in text:
-                # Extract task ID
-                task_id = int(text.split(":", 1)[0])
-                
-                # Find the parent KanbanColumn
-                parent = self.parent()
-                while parent and not isinstance(parent, KanbanColumn):
-                    parent = parent.parent()
+        if mime_data.hasFormat(self.MIME_TYPE):
+            # Extract task ID
+            task_id = int(bytes(mime_data.data(self.MIME_TYPE)))
+            
+            # The KanbanColumn showing this task; for an orphaned task that
+            # is the first column rather than one matching its status
+            parent = self.column
+            
+            if parent is not None:
+                # Insert the task at this task's position
+                this_idx = parent.task_widgets.index(self)
                 
-                if parent and isinstance(parent, KanbanColumn):
-                    # Find the index where the task should be inserted
-                    this_idx = -1
-                    for i in range(parent.tasks_layout.count()):
-                        item = parent.tasks_layout.itemAt(i)
-                        if item and item.widget() == self:
-                            this_idx = i
-                            break
-                    
-                    if this_idx >= 0:
-                        # Signal to the column that a task has been dropped for reordering
-                        parent.taskReordered.emit(task_id, this_idx)
+                # Signal to the column that a task has been dropped for reordering
+                parent.taskReordered.emit(task_id, this_idx)
                         
         event.acceptProposedAction()
     
     def mouseDoubleClickEvent(self, event):
         """Handle double-click to open task editor."""
         if event.button() == Qt.LeftButton:
-            self.doubleClicked.emit(self.task)
+            self.board.editTask(self.task)
     
     def _on_edit_clicked(self):
-        """Emit signal when edit button is clicked."""
-        self.edit_clicked.emit(self.task)
+        """Edit the task when the edit button is clicked."""
+        self.board.editTask(self.task)
     
     def _on_delete_clicked(self):
-        """Emit signal when delete button is clicked."""
-        self.delete_clicked.emit(self.task)
+        """Delete the task when the delete button is clicked."""
+        self.board.deleteTask(self.task)
 
 
 class KanbanColumn(QWidget):
@@ -243,14 +590,74 @@ class KanbanColumn(QWidget):
     taskReordered = pyqtSignal(int, int)  # Task ID, new position
     taskDoubleClicked = pyqtSignal(object)  # Signals when a task is double-clicked (task_object)
     taskAdded = pyqtSignal(str)  # Signal to add a task to this status
+    moreTasksRequested = pyqtSignal(str)  # Signal to show the next batch of tasks (status)
     
-    def __init__(self, status, title, color="#f0f0f0", parent=None):
+    # Number of task widgets created at a time, about two screens of cards;
+    # further tasks get widgets only once the user scrolls near them, or
+    # while the loaded cards do not fill the column. Until then they are
+    # stood in for by a spacer of their estimated height.
+    TASK_BATCH_SIZE = 20
+    
+    # MIME type of dragged columns; the data is the column's status as UTF-8
+    MIME_TYPE = "application/x-kanban-column"
+    
+    # Styles of the column's header controls and scroll area, set together
+    # with the column color in _applyColor
+    STYLESHEET = """
+        QLabel#columnTitle {
+            color: #2c3e50;
+        }
+        QPushButton#addTaskButton {
+            background-color: #27ae60;
+            color: white !important;
+            border: none;
+            border-radius: 14px;
+            padding-bottom: 6px;
+        }
+        QPushButton#addTaskButton:hover {
+            background-color: #2ecc71;
+        }
+        QPushButton#addTaskButton:pressed {
+            background-color: #219653;
+        }
+        QScrollArea#tasksScroll {
+            border: none;
+            background-color: transparent;
+        }
+        QScrollArea#tasksScroll QScrollBar:vertical {
+            border: none;
+            background: rgba(0, 0, 0, 0.05);
+            width: 8px;
+            border-radius: 4px;
+            margin: 0px;
+        }
+        QScrollArea#tasksScroll QScrollBar::handle:vertical {
+            background: rgba(0, 0, 0, 0.2);
+            border-radius: 4px;
+            min-height: 20px;
+        }
+        QScrollArea#tasksScroll QScrollBar::add-line:vertical,
+        QScrollArea#tasksScroll QScrollBar::sub-line:vertical {
+            height: 0px;
+        }
+    """
+    
+    def __init__(self, status, title, color="#f0f0f0", board=None, parent=None):
         super().__init__(parent)
+        self.board = board  # The KanbanBoard showing this column
         self.title = title
         self.status = status  # The status this column represents (todo, in_progress, etc.)
+        self._mime_data = QByteArray(status.encode("utf-8"))  # This column's drag payload
         self.color = color  # Background color for the column
         self.setAcceptDrops(True)
         
+        # All tasks of this column in display order, and how many of them have widgets
+        self.tasks = []
+        self.task_limit = self.TASK_BATCH_SIZE
+        
+        # Task widgets in layout order, kept in sync by addTaskWidget/removeTaskWidget
+        self.task_widgets = []
+        
         # Drop indicator flag
         self.drop_indicator_visible = False
         self.drop_indicator_side = None  # "left" or "right"
@@ -264,77 +671,30 @@ class KanbanColumn(QWidget):
         self.setLayout(main_layout)
         
         # Set size policy to expand horizontally and vertically
-        from PyQt5.QtWidgets import QSizePolicy
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         
-        # Set the column background color with a more professional appearance
-        self.setStyleSheet(f"""
-            QWidget {{ 
-                background-color: {self.color}; 
-                border-radius: 8px;
-                border: 1px solid #d0d0d0;
-            }}
-        """)
-        
-        # Create a header container with styling
+        # Create a header container; its colors are set by _applyColor
         header_container = QFrame()
         header_container.setMinimumHeight(40)
         header_container.setMaximumHeight(40)
         header_container.setObjectName("headerContainer")
-        header_container.setStyleSheet(f"""
-            #headerContainer {{
-                background-color: {self.darken_color(self.color, 0.05)};
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                border-bottom: 1px solid #d0d0d0;
-            }}
-            
-            #headerContainer:hover {{
-                background-color: {self.darken_color(self.color, 0.1)};
-            }}
-        """)
+        self.header_container = header_container
         
         header_layout = QHBoxLayout(header_container)
         header_layout.setContentsMargins(10, 0, 10, 0)
         
-        # Create a drag handle container to highlight it better
-        drag_handle_container = QFrame()
-        drag_handle_container.setFixedSize(24, 24)
-        drag_handle_container.setObjectName("dragHandleContainer")
-        drag_handle_container.setStyleSheet("""
-            #dragHandleContainer {
-                background-color: rgba(0, 0, 0, 0.05);
-                border-radius: 4px;
-                border: none;
-            }
-            #dragHandleContainer:hover {
-                background-color: rgba(0, 0, 0, 0.1);
-            }
-        """)
-        drag_handle_layout = QHBoxLayout(drag_handle_container)
-        drag_handle_layout.setContentsMargins(0, 0, 0, 0)
-        drag_handle_layout.setSpacing(0)
-        
         # Add drag handle icon
-        self.drag_handle = QLabel("☰")  # Unicode "trigram for heaven" symbol as a drag handle
-        self.drag_handle.setFont(QFont("Segoe UI", 12))
-        self.drag_handle.setStyleSheet("""
-            color: #555;
-            padding: 0px;
-        """)
-        self.drag_handle.setCursor(Qt.SizeAllCursor)  # Set cursor directly on widget instead of via stylesheet
-        self.drag_handle.setAlignment(Qt.AlignCenter)
+        self.drag_handle = _ColumnDragHandle()
+        self.drag_handle.setCursor(Qt.SizeAllCursor)
         self.drag_handle.setToolTip("Drag to reorder column")
         self.drag_handle.setMouseTracking(True)
         self.drag_handle.installEventFilter(self)
-        
-        drag_handle_layout.addWidget(self.drag_handle)
-        header_layout.addWidget(drag_handle_container)
+        header_layout.addWidget(self.drag_handle)
         
         # Title (click and drag to move)
         self.title_label = QLabel(self.title)
-        self.title_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.title_label.setStyleSheet("color: #2c3e50;")  # Remove cursor move since we have a dedicated handle
+        self.title_label.setFont(_COLUMN_TITLE_FONT)
+        self.title_label.setObjectName("columnTitle")
         self.title_label.setToolTip("Drag the handle to reorder column")
         
         # Title no longer needs to be draggable, we use just the handle
@@ -346,25 +706,9 @@ class KanbanColumn(QWidget):
         # "+" button with manual vertical alignment adjustment
         add_btn = QPushButton("+")
         add_btn.setFixedSize(28, 28)
-        add_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        add_btn.setFont(_COLUMN_ADD_BUTTON_FONT)
         add_btn.setContentsMargins(0, 0, 0, 0)
-        
-        # Force white text color with !important to override any default styling
-        add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white !important;
-                border: none;
-                border-radius: 14px;
-                padding-bottom: 6px;
-            }
-            QPushButton:hover {
-                background-color: #2ecc71;
-            }
-            QPushButton:pressed {
-                background-color: #219653;
-            }
-        """)
+        add_btn.setObjectName("addTaskButton")
         add_btn.clicked.connect(self.addTask)
         header_layout.addWidget(add_btn)
         
@@ -374,57 +718,68 @@ class KanbanColumn(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)  # Remove border
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: rgba(0, 0, 0, 0.05);
-                width: 8px;
-                border-radius: 4px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(0, 0, 0, 0.2);
-                border-radius: 4px;
-                min-height: 20px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        scroll.setObjectName("tasksScroll")
         
         # Container for task widgets
-        self.tasks_container = QWidget()
-        self.tasks_container.setStyleSheet(f"background-color: {self.color};")
+        self.tasks_container = _TasksContainer()
         self.tasks_layout = QVBoxLayout()
         self.tasks_layout.setAlignment(Qt.AlignTop)
         self.tasks_layout.setContentsMargins(5, 5, 5, 5)
         self.tasks_layout.setSpacing(10)  # Increased space between tasks
+        # Room for the tasks without a widget yet, so the scroll bar spans the whole column
+        self._unloaded_spacer = QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Fixed)
+        self.tasks_layout.addSpacerItem(self._unloaded_spacer)
+        self.tasks_layout.addStretch()  # Keep task widgets packed at the top
         self.tasks_container.setLayout(self.tasks_layout)
         
         scroll.setWidget(self.tasks_container)
         main_layout.addWidget(scroll)
+        
+        self._applyColor()
+        
+        # Show more tasks when scrolling near the end of the column
+        self.scroll = scroll
+        self.scroll.verticalScrollBar().valueChanged.connect(self.onScrolled)
+        self.scroll.verticalScrollBar().rangeChanged.connect(self.onScrollRangeChanged)
+    
+    def onScrolled(self, value):
+        """Request task widgets for the unloaded tasks scrolled near the view."""
+        if len(self.tasks) <= self.task_limit:
+            return
+        # Load a page ahead of the view, and at least a batch at a time
+        # Where the spacer starts, estimated like its height: new cards are
+        # not laid out yet when the scroll range changes
+        page = self.scroll.verticalScrollBar().pageStep()
+        task_height = self._estimatedTaskHeight()
+        unloaded_top = self.task_limit * task_height
+        if value + 2 * page >= unloaded_top:
+            needed = -(-(value + 2 * page - unloaded_top) // task_height)
+            self.task_limit += max(self.TASK_BATCH_SIZE, needed)
+            self.moreTasksRequested.emit(self.status)
+    
+    def onScrollRangeChanged(self, minimum, maximum):
+        """Keep requesting batches while the loaded task widgets barely fill the column."""
+        self.onScrolled(self.scroll.verticalScrollBar().value())
+    
+    def _estimatedTaskHeight(self):
+        """Height of a task card plus spacing, averaged over the loaded cards."""
+        spacing = self.tasks_layout.spacing()
+        if not self.task_widgets:
+            return TaskWidget.MIN_HEIGHT + spacing
+        total = sum(widget.sizeHint().height() for widget in self.task_widgets)
+        return max(1, total // len(self.task_widgets)) + spacing
+    
+    def updateUnloadedSpace(self):
+        """Size the spacer standing in for the tasks beyond task_limit."""
+        unloaded = max(0, len(self.tasks) - self.task_limit)
+        height = unloaded * self._estimatedTaskHeight() if unloaded else 0
+        if height != self._unloaded_spacer.sizeHint().height():
+            self._unloaded_spacer.changeSize(0, height, QSizePolicy.Minimum, QSizePolicy.Fixed)
+            self.tasks_layout.invalidate()
     
     def darken_color(self, hex_color, factor=0.1):
         """Darken a hex color by a factor."""
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
-        
-        # Convert to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        
-        # Darken
-        r = max(0, int(r * (1 - factor)))
-        g = max(0, int(g * (1 - factor)))
-        b = max(0, int(b * (1 - factor)))
-        
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return _darkenColor(hex_color, factor)
     
     def eventFilter(self, obj, event):
         """Handle mouse events for the column header."""
@@ -440,17 +795,16 @@ class KanbanColumn(QWidget):
                 # Create drag object
                 drag = QDrag(self)  
                 mime_data = QMimeData()
-                mime_data.setText(f"kanban_column:{self.status}")
+                mime_data.setData(self.MIME_TYPE, self._mime_data)
                 drag.setMimeData(mime_data)
                 
-                # Create pixmap for dragging
-                pixmap = self.grab()
-                # Scale down pixmap for better visual during drag
-                scaled_pixmap = pixmap.scaled(int(pixmap.width() * 0.8), int(pixmap.height() * 0.8), 
-                                           Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                # Create pixmap for dragging, rendered straight at 80% size for
+                # better visual during drag rather than grabbed and scaled down
+                ratio = self.devicePixelRatioF()
+                scaled_pixmap = _renderDragPixmap(self, 0.8)
                 drag.setPixmap(scaled_pixmap)
                 # Adjust hotspot for more intuitive dragging
-                drag.setHotSpot(QPoint(scaled_pixmap.width() // 2, 20))
+                drag.setHotSpot(QPoint(int(scaled_pixmap.width() / ratio) // 2, 20))
                 
                 # Execute the drag
                 drag.exec_(Qt.MoveAction)
@@ -458,18 +812,34 @@ class KanbanColumn(QWidget):
                 
         return super().eventFilter(obj, event)
     
+    def _dropIndicatorRect(self, side):
+        """Get the edge band the drop indicator of a side is drawn in."""
+        if side == "left":
+            return QRect(0, 0, 4, self.height())
+        return QRect(self.width() - 4, 0, 4, self.height())
+    
+    def _setDropIndicator(self, side):
+        """Show the drop indicator on a side ("left" or "right"), or hide it for None."""
+        old_side = self.drop_indicator_side if self.drop_indicator_visible else None
+        if side == old_side:
+            return
+        self.drop_indicator_visible = side is not None
+        self.drop_indicator_side = side
+        
+        # Repaint only the edge bands the indicator leaves and enters
+        for changed_side in (old_side, side):
+            if changed_side is not None:
+                self.update(self._dropIndicatorRect(changed_side))
+    
     def paintEvent(self, event):
         """Override paint event to draw drop indicators when needed."""
         super().paintEvent(event)
         
         # If we're showing a drop indicator, draw it
         if self.drop_indicator_visible and self.drop_indicator_side:
+            # A straight vertical line needs no antialiasing
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.Antialiasing)
-            
-            # Use a bright blue color for the indicator
-            indicator_color = QColor("#2980b9")
-            painter.setPen(QPen(indicator_color, 4))
+            painter.setPen(_DROP_INDICATOR_PEN)
             
             if self.drop_indicator_side == "left":
                 # Draw indicator on left side
@@ -480,170 +850,157 @@ class KanbanColumn(QWidget):
     
     def setTitle(self, title):
         """Set the column title."""
-        self.title = title
-        self.title_label.setText(title)
+        if title != self.title:
+            self.title = title
+            self.title_label.setText(title)
+    
+    def setColor(self, color):
+        """Set the column background color."""
+        if color != self.color:
+            self.color = color
+            self._applyColor()
+    
+    def _applyColor(self):
+        """Style the column, its header and its task container with self.color."""
+        # Set the column background color with a more professional appearance
+        self.setStyleSheet(f"""
+            QWidget {{ 
+                background-color: {self.color}; 
+                border-radius: 8px;
+                border: 1px solid #d0d0d0;
+            }}
+        """ + self.STYLESHEET)
+        self.drag_handle.setColor(self.color)
+        
+        self.header_container.setStyleSheet(f"""
+            #headerContainer {{
+                background-color: {self.darken_color(self.color, 0.05)};
+                border-top-left-radius: 8px;
+                border-top-right-radius: 8px;
+                border-bottom: 1px solid #d0d0d0;
+            }}
+            
+            #headerContainer:hover {{
+                background-color: {self.darken_color(self.color, 0.1)};
+            }}
+        """)
+        
+        # The task cards share TaskWidget.STYLESHEET through this container
+        self.tasks_container.setStyleSheet(
+            f"QWidget {{ background-color: {self.color}; }}" + TaskWidget.STYLESHEET)
     
     def addTask(self):
         """Add a new task to this column by signalling the parent KanbanBoard."""
-        # Find the KanbanBoard in the parent widget hierarchy
-        parent = self.parent()
-        while parent and not isinstance(parent, KanbanBoard):
-            parent = parent.parent()
-            
-        if parent and isinstance(parent, KanbanBoard):
-            parent.addTask(self.status)
-        else:
-            print("Error: Could not find KanbanBoard parent")
+        self.taskAdded.emit(self.status)
     
-    def addTaskWidget(self, task_widget):
-        """Add a task widget to this column."""
-        self.tasks_layout.addWidget(task_widget)
+    def addTaskWidget(self, task_widget, index=None):
+        """Add a task widget to this column.
+        
+        Args:
+            task_widget: The TaskWidget to place in this column
+            index: Position within the column, or None to append
+        """
+        # The trailing stretch always stays last, after the task widgets
+        if index is None:
+            index = len(self.task_widgets)
+        
+        if index < len(self.task_widgets) and self.task_widgets[index] is task_widget:
+            return
+        # Take the widget from the column showing it, this one or another
+        if task_widget.column is not None:
+            task_widget.column.removeTaskWidget(task_widget)
         
-        # Connect to the task widget's signals
-        task_widget.doubleClicked.connect(self.onTaskDoubleClicked)
+        self.task_widgets.insert(index, task_widget)
+        self.tasks_layout.insertWidget(index, task_widget)
+        task_widget.column = self
+    
+    def removeTaskWidget(self, task_widget):
+        """Remove a task widget from this column without deleting it."""
+        if task_widget.column is self:
+            self.task_widgets.remove(task_widget)
+            self.tasks_layout.removeWidget(task_widget)
+            task_widget.column = None
     
     def dragEnterEvent(self, event):
+        # Only task and column drags are accepted
         mime_data = event.mimeData()
-        if mime_data.hasText():
-            text = mime_data.text()
-            if text.startswith("kanban_column:"):
-                # This is a column being dragged
-                dragged_status = text.split(":", 1)[1]
-                if dragged_status != self.status:  # Don't accept drag from self
-                    event.acceptProposedAction()
-                    # Show drop indicator
-                    self.drop_indicator_visible = True
-                    # Determine which side to show the indicator
-                    self.drop_indicator_side = "left" if event.pos().x() < self.width() / 2 else "right"
-                    self.update()  # Trigger repaint
-            elif ":task" in text:
-                # This is a task being dragged
-                event.acceptProposedAction()
-            else:
-                # Legacy support for old format (just task ID)
+        if mime_data.hasFormat(TaskWidget.MIME_TYPE):
+            # This is a task being dragged
+            event.acceptProposedAction()
+        elif mime_data.hasFormat(self.MIME_TYPE):
+            # This is a column being dragged
+            if mime_data.data(self.MIME_TYPE) != self._mime_data:  # Don't accept drag from self
                 event.acceptProposedAction()
+                # Show drop indicator on the side the column would go
+                self._setDropIndicator("left" if event.pos().x() < self.width() / 2 else "right")
     
     def dragMoveEvent(self, event):
         # Accept drag move events to enable proper drop positioning
         mime_data = event.mimeData()
-        if mime_data.hasText():
-            text = mime_data.text()
-            if text.startswith("kanban_column:"):
-                dragged_status = text.split(":", 1)[1]
-                if dragged_status != self.status:  # Don't accept drag from self
-                    event.acceptProposedAction()
-                    # Show drop indicator and update position
-                    self.drop_indicator_visible = True
-                    # Determine which side to show the indicator
-                    self.drop_indicator_side = "left" if event.pos().x() < self.width() / 2 else "right"
-                    self.update()  # Trigger repaint
-            else:
+        if mime_data.hasFormat(TaskWidget.MIME_TYPE):
+            event.acceptProposedAction()
+        elif mime_data.hasFormat(self.MIME_TYPE):
+            if mime_data.data(self.MIME_TYPE) != self._mime_data:  # Don't accept drag from self
                 event.acceptProposedAction()
+                # Show drop indicator and update position; this runs for
+                # every mouse move, but only a side change repaints
+                self._setDropIndicator("left" if event.pos().x() < self.width() / 2 else "right")
     
     def dragLeaveEvent(self, event):
         """Hide drop indicator when drag leaves."""
-        self.drop_indicator_visible = False
-        self.update()  # Trigger repaint
+        self._setDropIndicator(None)
         super().dragLeaveEvent(event)
     
     def dropEvent(self, event):
         # Hide drop indicator
-        self.drop_indicator_visible = False
-        self.update()  # Trigger repaint
+        self._setDropIndicator(None)
         
         mime_data = event.mimeData()
-        if mime_data.hasText():
-            text = mime_data.text()
-            if text.startswith("kanban_column:"):
-                # Extract dragged column ID
-                dragged_column_id = text.split(":", 1)[1]
-                
-                # Find the KanbanBoard parent
-                kanban_board = None
-                current = self
-                while current:
-                    if isinstance(current.parent(), QWidget) and hasattr(current.parent(), 'columns'):
-                        kanban_board = current.parent()
-                        break
-                    current = current.parent()
-                
-                if kanban_board:
-                    # Get visible columns in the correct order
-                    all_columns = []
-                    for i in range(kanban_board.columns_layout.count()):
-                        item = kanban_board.columns_layout.itemAt(i)
-                        if item and item.widget() and isinstance(item.widget(), KanbanColumn):
-                            all_columns.append(item.widget())
-                    
-                    # Find the index of this column
-                    target_index = -1
-                    for i, col in enumerate(all_columns):
-                        if col == self:
-                            target_index = i
-                            # Adjust target index based on drop position (left or right side)
-                            if event.pos().x() > self.width() / 2:
-                                target_index += 1  # Drop on right side moves to position after this column
-                            break
-                    
-                    if target_index >= 0:
-                        # Emit signal to move column
-                        self.columnMoved.emit(dragged_column_id, target_index)
-            elif ":task" in text:
-                # Extract task ID
-                task_id = int(text.split(":", 1)[0])
-                
-                # If dropped directly on the column (not on a task)
-                # Find the nearest task based on drop position
-                drop_position = event.pos().y()
-                insert_index = 0  # Default to top position
-                
-                # Find the index where the task should be inserted
-                for i in range(self.tasks_layout.count()):
-                    item = self.tasks_layout.itemAt(i)
-                    if item and item.widget() and isinstance(item.widget(), TaskWidget):
-                        widget = item.widget()
-                        widget_pos = widget.mapTo(self, QPoint(0, 0)).y()
-                        widget_height = widget.height()
-                        widget_center = widget_pos + widget_height / 2
-                        
-                        if drop_position < widget_center:
-                            # Found the position - drop before this widget
-                            break
-                        insert_index = i + 1
-                
-                # Handle the drop - either status change or reordering
-                source_task = None
-                for column in self.parent().findChildren(KanbanColumn):
-                    for i in range(column.tasks_layout.count()):
-                        item = column.tasks_layout.itemAt(i)
-                        if item and item.widget() and isinstance(item.widget(), TaskWidget):
-                            task_widget = item.widget()
-                            if task_widget.task.id == task_id:
-                                source_task = task_widget.task
-                                break
-                    if source_task:
-                        break
+        if mime_data.hasFormat(TaskWidget.MIME_TYPE):
+            # Extract task ID
+            task_id = int(bytes(mime_data.data(TaskWidget.MIME_TYPE)))
+            
+            # If dropped directly on the column (not on a task)
+            # Find the nearest task based on drop position
+            drop_position = event.pos().y()
+            insert_index = 0  # Default to top position
+            
+            # Find the index where the task should be inserted
+            for i, widget in enumerate(self.task_widgets):
+                widget_pos = widget.mapTo(self, QPoint(0, 0)).y()
+                widget_height = widget.height()
+                widget_center = widget_pos + widget_height / 2
                 
-                if source_task and source_task.status != self.status:
-                    # Status change (moved to different column)
-                    self.taskDropped.emit(task_id, self.status)
-                else:
-                    # Reordering within the same column
-                    self.taskReordered.emit(task_id, insert_index)
-            else:
-                # Legacy support for old format (just task ID)
-                task_id = int(text)
+                if drop_position < widget_center:
+                    # Found the position - drop before this widget
+                    break
+                insert_index = i + 1
+            
+            # Handle the drop - either status change or reordering. The
+            # dragged card is looked up by ID rather than searched for.
+            source_widget = self.board.taskWidget(task_id) if self.board else None
+            if source_widget is None or source_widget.column is not self:
+                # Status change (moved to different column)
                 self.taskDropped.emit(task_id, self.status)
+            else:
+                # Reordering within the same column
+                self.taskReordered.emit(task_id, insert_index)
+        elif mime_data.hasFormat(self.MIME_TYPE):
+            # Extract dragged column ID
+            dragged_column_id = bytes(mime_data.data(self.MIME_TYPE)).decode("utf-8")
+            
+            # The board's columns are kept in display order
+            if self.board and self.status in self.board.columns:
+                target_index = list(self.board.columns).index(self.status)
+                # Adjust target index based on drop position (left or right side)
+                if event.pos().x() > self.width() / 2:
+                    target_index += 1  # Drop on right side moves to position after this column
+                
+                # Emit signal to move column
+                self.columnMoved.emit(dragged_column_id, target_index)
         
         event.acceptProposedAction()
-        
-        # No need to update task counts anymore since we removed the counter
-        # Update task counts for all columns after drop
-        # if self.parent():
-        #     for column in self.parent().findChildren(KanbanColumn):
-        #         if hasattr(column, 'updateTaskCount'):
-        #             column.updateTaskCount()
-                
+    
     def onTaskDoubleClicked(self, item):
         """Handle double-click on a task item."""
         # Get the task data stored in the item
@@ -657,25 +1014,145 @@ class KanbanBoard(QWidget):
     
     refreshRequired = pyqtSignal()  # Signal to indicate a refresh is needed
     
-    def __init__(self, db, program_id, patient_id=None, parent=None):
-        """Initialize KanbanBoard with the database and program ID."""
+    # Default colors for common column types if not specified in config
+    DEFAULT_COLUMN_COLORS = {
+        "todo": "#f0f7ff",       # Light blue for To Do
+        "backlog": "#f5f5f5",    # Light grey for Backlog
+        "in_progress": "#fff7e6", # Light orange for In Progress
+        "review": "#f5f0ff",     # Light purple for Review
+        "testing": "#fff0f7",    # Light pink for Testing
+        "done": "#f0fff5"        # Light green for Done
+    }
+    
+    # Columns of a board without any configuration; copy before use
+    DEFAULT_COLUMNS = (
+        {"id": "todo", "title": "To Do", "color": DEFAULT_COLUMN_COLORS["todo"]},
+        {"id": "in_progress", "title": "In Progress", "color": DEFAULT_COLUMN_COLORS["in_progress"]},
+        {"id": "done", "title": "Done", "color": DEFAULT_COLUMN_COLORS["done"]},
+    )
+    
+    # Milliseconds to wait for further drops before writing status changes
+    STATUS_FLUSH_DELAY = 150
+    
+    # Shortest auto-refresh interval in milliseconds; every check reads the
+    # board revision from the database
+    MIN_REFRESH_INTERVAL = 5000
+    
+    # User settings shared by all boards; see userSettings
+    _user_settings = None
+    
+    # Styles of the board header and its controls, set once on the header.
+    # The QFrame rule also gives the header labels their background and border.
+    HEADER_STYLESHEET = """
+        QFrame {
+            background-color: #f8f9fb;
+            border-radius: 8px;
+            border: 1px solid #e0e4e8;
+        }
+        QLabel#programTitle {
+            color: #2c3e50;
+        }
+        QLabel#patientName {
+            color: #34495e;
+            margin-left: 15px;
+        }
+        QPushButton#editProgramButton, QPushButton#customizeColumnsButton {
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 15px;
+            min-width: 120px;
+        }
+        QPushButton#editProgramButton {
+            background-color: #3498db;
+        }
+        QPushButton#editProgramButton:hover {
+            background-color: #2980b9;
+        }
+        QPushButton#editProgramButton:pressed {
+            background-color: #1c5b8c;
+        }
+        QPushButton#customizeColumnsButton {
+            background-color: #2ecc71;
+        }
+        QPushButton#customizeColumnsButton:hover {
+            background-color: #27ae60;
+        }
+        QPushButton#customizeColumnsButton:pressed {
+            background-color: #1e8449;
+        }
+    """
+    
+    # Styles of the program name dialog; see editProgram
+    EDIT_PROGRAM_STYLESHEET = """
+        QDialog {
+            background-color: #f8f9fb;
+        }
+        QLabel {
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            color: #2c3e50;
+        }
+        QLineEdit {
+            border: 1px solid #dcdfe6;
+            border-radius: 4px;
+            padding: 8px;
+            background-color: white;
+            font-family: 'Segoe UI';
+            font-size: 11pt;
+            color: #2c3e50;
+        }
+        QPushButton {
+            padding: 8px 16px;
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #2980b9;
+        }
+    """
+    
+    @classmethod
+    def userSettings(cls):
+        """Get the user's board settings: conflict resolution mode and refresh interval.
+        
+        They are read from QSettings once per process; call settingsChanged
+        after changing them there.
+        """
+        if cls._user_settings is None:
+            config = QSettings("MedicalPatientManager", "KanbanBoard")
+            cls._user_settings = {
+                # Conflict resolution mode, default last writer wins
+                "conflict_resolution_mode": config.value("conflict_resolution_mode", "last_wins"),
+                # Refresh interval in milliseconds, default 5 seconds
+                "refresh_interval": int(config.value("refresh_interval", 5000)),
+            }
+        return cls._user_settings
+    
+    @classmethod
+    def settingsChanged(cls):
+        """Make boards created from now on read the user's settings again."""
+        cls._user_settings = None
+    
+    def __init__(self, db, program_id, patient_id=None, parent=None, program=None, patient=None):
+        """Initialize KanbanBoard with the database and program ID.
+        
+        Callers that already hold the Program (and Patient) can pass them to
+        spare the board looking them up for its header.
+        """
         super().__init__(parent)
         self.db = db
         self.program_id = program_id
         self.patient_id = patient_id
-        self.config = QSettings("MedicalPatientManager", "KanbanBoard")
+        self._header_program = program
+        self._header_patient = patient
         
-        # Get conflict resolution mode from user settings or use default
-        self.conflict_resolution_mode = self.config.value(
-            "conflict_resolution_mode", 
-            "last_wins"
-        )
-        
-        # Get refresh interval from user settings or use default (5 seconds)
-        self.refresh_interval = int(self.config.value(
-            "refresh_interval", 
-            5000
-        ))
+        # Get conflict resolution mode and refresh interval from user settings
+        settings = self.userSettings()
+        self.conflict_resolution_mode = settings["conflict_resolution_mode"]
+        self.refresh_interval = settings["refresh_interval"]
         
         # Dictionary to track task versions
         self.task_versions = {}
@@ -683,6 +1160,44 @@ class KanbanBoard(QWidget):
         # Dictionary to store columns by ID
         self.columns = {}  # This makes columns a dictionary
         
+        # Task widgets currently shown on the board, keyed by task ID
+        self._widget_index = {}
+        
+        # Refresh requests made while one is pending or running are coalesced
+        self._refresh_pending = False
+        self._refresh_in_flight = False
+        self._pending_refresh_timer = QTimer(self)
+        self._pending_refresh_timer.setSingleShot(True)
+        self._pending_refresh_timer.setInterval(0)
+        self._pending_refresh_timer.timeout.connect(self._runRefresh)
+        
+        # Status changes of dropped tasks not yet written, by task ID:
+        # (new status, version the task had before its first pending drop)
+        self._pending_status = {}
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(self.STATUS_FLUSH_DELAY)
+        self._status_flush_timer.timeout.connect(self._flushStatusUpdates)
+        
+        # Caches of the program's tasks and column configuration. The board's
+        # own task additions, edits and deletions are applied to the task
+        # cache; changes it cannot mirror invalidate it instead.
+        self._tasks_cache = None
+        self._config_cache = None
+        
+        # Column customization dialog, built on first use; see customizeColumns
+        self._customize_dialog = None
+        
+        # Tasks are fetched on the thread pool. Each invalidation of the
+        # cache starts a new generation; results of older ones are dropped.
+        self._tasks_generation = 0
+        self._tasks_fetcher = None
+        self._load_waiting = False  # A load waits for the fetch
+        self._check_waiting = False  # An update check waits for the fetch
+        
+        # Board revision seen by the last update check
+        self._last_board_rev = None
+        
         # Setup the UI
         self.initUI()
         
@@ -692,7 +1207,7 @@ class KanbanBoard(QWidget):
         # Setup refresh timer
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.checkForUpdates)
-        self.refresh_timer.start(self.refresh_interval)
+        self.setRefreshInterval(self.refresh_interval)
     
     def initUI(self):
         layout = QVBoxLayout()
@@ -712,32 +1227,26 @@ class KanbanBoard(QWidget):
         # Header with improved styling
         header_container = QFrame()
         header_container.setMaximumHeight(60)
-        header_container.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fb;
-                border-radius: 8px;
-                border: 1px solid #e0e4e8;
-            }
-        """)
         
         header_layout = QHBoxLayout(header_container)
         header_layout.setContentsMargins(15, 0, 15, 0)
         
         # Program title with better typography
-        program_name = self.db.get_program_by_id(self.program_id).name
-        title = QLabel(program_name)
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50;")
-        header_layout.addWidget(title)
+        program = self._header_program or self.db.get_program_by_id(self.program_id)
+        program_name = program.name
+        self.program_title_label = QLabel(program_name)
+        self.program_title_label.setObjectName("programTitle")
+        self.program_title_label.setFont(_BOARD_TITLE_FONT)
+        header_layout.addWidget(self.program_title_label)
         
         # Patient name (if available)
         if self.patient_id:
             try:
-                patient = self.db.get_patient_by_id(self.patient_id)
+                patient = self._header_patient or self.db.get_patient_by_id(self.patient_id)
                 if patient:
                     patient_label = QLabel(f"Patient: {patient.first_name} {patient.last_name}")
-                    patient_label.setFont(QFont("Segoe UI", 12))
-                    patient_label.setStyleSheet("color: #34495e; margin-left: 15px;")
+                    patient_label.setObjectName("patientName")
+                    patient_label.setFont(_BOARD_PATIENT_FONT)
                     header_layout.addWidget(patient_label)
             except Exception as e:
                 print(f"Error retrieving patient details: {e}")
@@ -752,60 +1261,31 @@ class KanbanBoard(QWidget):
         
         # Redesigned buttons for program management
         self.edit_program_btn = QPushButton("Edit Program")
-        self.edit_program_btn.setFont(QFont("Segoe UI", 10))
+        self.edit_program_btn.setFont(_BOARD_BUTTON_FONT)
+        self.edit_program_btn.setObjectName("editProgramButton")
         self.edit_program_btn.setCursor(Qt.PointingHandCursor)
-        self.edit_program_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 15px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:pressed {
-                background-color: #1c5b8c;
-            }
-        """)
         self.edit_program_btn.clicked.connect(self.editProgram)
         button_layout.addWidget(self.edit_program_btn)
         
         # Button for customizing column titles with matching style
         self.customize_columns_btn = QPushButton("Customize Columns")
-        self.customize_columns_btn.setFont(QFont("Segoe UI", 10))
+        self.customize_columns_btn.setFont(_BOARD_BUTTON_FONT)
+        self.customize_columns_btn.setObjectName("customizeColumnsButton")
         self.customize_columns_btn.setCursor(Qt.PointingHandCursor)
-        self.customize_columns_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 15px;
-                min-width: 120px;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-            QPushButton:pressed {
-                background-color: #1e8449;
-            }
-        """)
         self.customize_columns_btn.clicked.connect(self.customizeColumns)
         button_layout.addWidget(self.customize_columns_btn)
         
         header_layout.addWidget(button_container)
+        header_container.setStyleSheet(self.HEADER_STYLESHEET)
         layout.addWidget(header_container)
         
         # Kanban columns container with enhanced styling
         columns_container = QWidget()
-        columns_container.setStyleSheet("""
-            QWidget {
-                background-color: #f0f2f5;
+        columns_container.setStyleSheet(f"""
+            QWidget {{
+                background-color: {_COLUMNS_AREA_COLOR};
                 border-radius: 8px;
-            }
+            }}
         """)
         self.columns_layout = QHBoxLayout(columns_container)
         self.columns_layout.setContentsMargins(0, 0, 0, 0)
@@ -819,177 +1299,394 @@ class KanbanBoard(QWidget):
         self.createColumns()
     
     def createColumns(self):
-        """Create columns for the kanban board based on configuration."""
+        """Create columns for the kanban board based on configuration.
+        
+        Columns that already exist are kept together with their task widgets;
+        see _updateColumns.
+        """
+        if self.columns_layout.count() == 0:
+            # Add stretch at the end to prevent columns from expanding too wide
+            self.columns_layout.addStretch(0)
+        
         try:
-            # First, remove the existing columns
-            for i in reversed(range(self.columns_layout.count())):
-                item = self.columns_layout.itemAt(i)
-                if item:
-                    widget = item.widget()
-                    if widget:
-                        widget.setParent(None)
+            self._updateColumns(self._getKanbanConfig())
+        except Exception:
+            logger.exception("Error creating columns")
+    
+    def _columnColor(self, config):
+        """Get a column's color, defaulting by column ID if none is configured."""
+        return config.get("color", self.DEFAULT_COLUMN_COLORS.get(config["id"].lower(), "#f5f7fa"))
+    
+    def _createColumn(self, config):
+        """Create a column for a column configuration and connect its signals."""
+        column = KanbanColumn(
+            title=config["title"], 
+            status=config["id"], 
+            color=self._columnColor(config),
+            board=self
+        )
+        
+        # Connect signals
+        column.taskDropped.connect(self.onTaskDropped)
+        column.taskReordered.connect(self.onTaskReordered)
+        column.taskDoubleClicked.connect(self.editTask)
+        column.taskAdded.connect(self.addTask)
+        column.columnMoved.connect(self.onColumnMoved)
+        column.moreTasksRequested.connect(self.onMoreTasksRequested)
+        
+        # Set a fixed minimum width for more consistent layout
+        column.setMinimumWidth(250)
+        return column
+    
+    def _updateColumns(self, column_configs):
+        """Bring the columns in line with a column configuration.
+        
+        The columns that are still configured are kept together with their
+        task widgets: their title and color are updated in place and only
+        added or removed columns are created or deleted.
+        """
+        configs_by_id = {config["id"]: config for config in column_configs}
+        old_order = list(self.columns)
+        
+        # Paint the board once, after all columns were updated
+        with _updatesSuspended(self):
+            # Remove the columns that are no longer configured
+            for status in [status for status in old_order if status not in configs_by_id]:
+                column = self.columns.pop(status)
+                for task_id, task_widget in list(self._widget_index.items()):
+                    if task_widget.column is column:
+                        del self._widget_index[task_id]
+                # Hidden rather than unparented: reparenting would restyle
+                # every card of the column just before it is deleted
+                self.columns_layout.removeWidget(column)
+                column.hide()
+                column.deleteLater()
             
-            # Clear the columns dictionary
-            self.columns = {}
+            # Update, create and order the configured columns
+            columns = {}
+            for index, config in enumerate(column_configs):
+                column = self.columns.get(config["id"])
+                if column is None:
+                    column = self._createColumn(config)
+                else:
+                    # Both setters skip values the column already has
+                    column.setTitle(config["title"])
+                    column.setColor(self._columnColor(config))
+                
+                if self.columns_layout.indexOf(column) != index:
+                    self.columns_layout.removeWidget(column)
+                    self.columns_layout.insertWidget(index, column, 1)
+                columns[config["id"]] = column
             
-            # Get column configuration based on current program
-            column_configs = self.db.get_program_kanban_config(self.program_id)
+            self.columns = columns
+        
+        # Tasks of removed columns and columns new to the board need placing,
+        # and a different first column changes where orphaned tasks show
+        if list(columns) != old_order:
+            self.loadTasks()
+    
+    def loadTasks(self):
+        """Request a reload of the tasks.
+        
+        The reload runs on the next event loop turn, so any number of calls
+        made in the same turn (or while a reload is running) result in a
+        single database fetch and UI sync.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        if not self._refresh_in_flight:
+            self._pending_refresh_timer.start()
+    
+    def _runRefresh(self):
+        """Run pending reloads until no new request arrives."""
+        self._refresh_in_flight = True
+        try:
+            while self._refresh_pending:
+                self._refresh_pending = False
+                self._doLoadTasks()
+        finally:
+            self._refresh_in_flight = False
+    
+    def _doLoadTasks(self):
+        """Load tasks into columns.
+        
+        Existing task widgets are reused: only new tasks get a widget, only
+        deleted tasks lose theirs, and tasks whose status changed are moved
+        to their new column. Each column only gets widgets for its first
+        batch of tasks; see KanbanColumn.TASK_BATCH_SIZE.
+        """
+        # Get tasks for the program; without cached ones, load once they arrive
+        tasks = self._tasks_cache
+        if tasks is None:
+            self._load_waiting = True
+            self._fetchTasks()
+            return
+        
+        # Group tasks by column; tasks whose status has no column (e.g. the
+        # column was removed) are shown in the first column. The database
+        # returns tasks ordered by status and order_index, so each column's
+        # tasks are already in order unless orphans were merged in.
+        col_by_status = self.columns
+        default_col = next(iter(col_by_status.values()), None)
+        tasks_by_column = {status: [] for status in col_by_status}
+        has_orphans = False
+        if default_col is not None:
+            for task in tasks:
+                column = col_by_status.get(task.status)
+                if column is None:
+                    column = default_col
+                    has_orphans = True
+                tasks_by_column[column.status].append(task)
+            if has_orphans:
+                tasks_by_column[default_col.status].sort(key=self._taskOrderKey)
+        
+        # Add, move and update tasks in columns, painting the board once
+        placed_ids = set()
+        with _updatesSuspended(self):
+            for status, column in col_by_status.items():
+                column.tasks = tasks_by_column[status]
+                placed_ids.update(self._syncColumn(column))
             
-            # If no program-specific config exists, use global config
-            if column_configs is None:
-                # Get column configuration from general settings
-                kanban_config = self.config.value("kanban_columns", [])
+            # Drop widgets of deleted tasks and of tasks not shown in any column
+            for task_id in set(self._widget_index) - placed_ids:
+                self._discardTaskWidget(task_id)
+        
+        # Store current task versions for concurrency control
+        self.task_versions = {task.id: task.version for task in tasks}
+    
+    def _syncColumn(self, column):
+        """Show the first column.task_limit tasks of a column in order.
+        
+        Returns:
+            set: IDs of the tasks shown in the column
+        """
+        shown_ids = set()
+        
+        # Repaint the column once after all inserts rather than as they happen
+        container = column.tasks_container
+        with _updatesSuspended(container):
+            for index, task in enumerate(column.tasks[:column.task_limit]):
+                task_widget = self._widget_index.get(task.id)
+                if task_widget is None:
+                    # Created in the container so the layout need not reparent it
+                    task_widget = TaskWidget(task, self, parent=container)
+                    # Shown now rather than later by the layout, so the column's
+                    # height never counts the spacer without the new cards
+                    task_widget.show()
+                    self._widget_index[task.id] = task_widget
+                else:
+                    # addTaskWidget takes the widget from the column it was in
+                    if task_widget.task_version != task.version:
+                        task_widget.updateFrom(task)
+                    else:
+                        task_widget.task = task
                 
-                # Handle old configuration format (dictionary with key-value pairs)
-                if isinstance(kanban_config, dict):
-                    # Convert old format to new format
-                    column_configs = [{"id": column_id, "title": kanban_config[column_id]} for column_id in kanban_config]
-                # Handle new configuration format (list of objects)
-                elif isinstance(kanban_config, list):
-                    column_configs = kanban_config
-            
-            # If no valid configuration (empty list or none), use defaults
-            if not column_configs:
-                column_configs = [
-                    {"id": "todo", "title": "To Do", "color": "#f0f7ff"},         # Light blue for To Do
-                    {"id": "in_progress", "title": "In Progress", "color": "#fff7e6"}, # Light orange for In Progress
-                    {"id": "done", "title": "Done", "color": "#f0fff5"}           # Light green for Done
-                ]
+                column.addTaskWidget(task_widget, index)
+                shown_ids.add(task.id)
             
-            # Define default colors for common column types if not specified in config
-            default_colors = {
-                "todo": "#f0f7ff",       # Light blue for To Do
-                "backlog": "#f5f5f5",    # Light grey for Backlog
-                "in_progress": "#fff7e6", # Light orange for In Progress
-                "review": "#f5f0ff",     # Light purple for Review
-                "testing": "#fff0f7",    # Light pink for Testing
-                "done": "#f0fff5"        # Light green for Done
-            }
+            # Drop cards that an insert above them pushed beyond the loaded
+            # batch; the spacer stands in for those tasks. Cards of tasks
+            # that left the column are kept for the column they moved to.
+            extra_widgets = column.task_widgets[len(shown_ids):]
+            if extra_widgets:
+                unloaded_ids = {task.id for task in column.tasks[column.task_limit:]}
+                for task_widget in extra_widgets:
+                    if task_widget.task.id in unloaded_ids:
+                        self._discardTaskWidget(task_widget.task.id)
+            column.updateUnloadedSpace()
+        return shown_ids
+    
+    def _discardTaskWidget(self, task_id):
+        """Remove a task's widget from its column and delete it."""
+        task_widget = self._widget_index.pop(task_id, None)
+        if task_widget is None:
+            return
+        
+        if task_widget.column is not None:
+            task_widget.column.removeTaskWidget(task_widget)
+        task_widget.hide()
+        task_widget.deleteLater()
+    
+    @staticmethod
+    def _taskOrderKey(task):
+        """Sort key matching the order of Database.get_tasks_by_program within a status."""
+        return (task.order_index, getattr(task, "created_at", None) or "", task.id)
+    
+    def onMoreTasksRequested(self, status):
+        """Create widgets for the next batch of tasks in a column."""
+        column = self.columns.get(status)
+        if column:
+            self._syncColumn(column)
+    
+    def _invalidateTasksCache(self):
+        """Drop cached tasks so the next load reads the database."""
+        self._tasks_cache = None
+        self._tasks_generation += 1
+    
+    def _fetchTasks(self):
+        """Fetch the program's tasks on the thread pool; see _onTasksFetched."""
+        if self._tasks_fetcher is not None:
+            # A fetch is running; if it is outdated, another follows it
+            return
+        self._flushStatusUpdates()
+        self._tasks_fetcher = _TasksFetcher(self.db, self.program_id, self._tasks_generation)
+        self._tasks_fetcher.signals.finished.connect(self._onTasksFetched)
+        QThreadPool.globalInstance().start(self._tasks_fetcher)
+    
+    @pyqtSlot(int, object)
+    def _onTasksFetched(self, generation, tasks):
+        """Cache fetched tasks and run the load or update check waiting for them."""
+        self._tasks_fetcher = None
+        if generation != self._tasks_generation:
+            # The cache was invalidated during the fetch, which may have
+            # missed the change
+            self._fetchTasks()
+            return
+        self._tasks_cache = tasks
+        
+        if self._check_waiting:
+            self._check_waiting = False
+            if self._tasksChanged(tasks):
+                self.refreshRequired.emit()
+                self._load_waiting = True
+        
+        if self._load_waiting:
+            self._load_waiting = False
+            self.loadTasks()
+    
+    def _replaceCachedTask(self, task):
+        """Replace the cached copy of a task whose status and order are unchanged."""
+        if self._tasks_cache is None:
+            return
+        for index, cached_task in enumerate(self._tasks_cache):
+            if cached_task.id == task.id:
+                self._tasks_cache[index] = task
+                return
+    
+    def refresh(self):
+        """Reload the column configuration and all tasks from the database."""
+        self._config_cache = None
+        self._invalidateTasksCache()
+        self.createColumns()
+        self.loadTasks()
+    
+    def _getKanbanConfig(self):
+        """Get the program's kanban column configuration, cached per board.
+        
+        Falls back to the global configuration in the settings, then to the
+        default columns, if the program has no configuration of its own.
+        """
+        if self._config_cache is not None:
+            return self._config_cache
+        
+        column_configs = self.db.get_program_kanban_config(self.program_id)
+        
+        # If no program-specific config exists, use global config
+        if column_configs is None:
+            # Get column configuration from general settings
+            kanban_config = QSettings("MedicalPatientManager", "KanbanBoard").value("kanban_columns", [])
             
-            # Now create the columns with professional styling
-            for config in column_configs:
-                # Use default color based on column ID if no color specified
-                column_id = config["id"].lower()
-                color = config.get("color", default_colors.get(column_id, "#f5f7fa"))
-                
-                column = KanbanColumn(
-                    title=config["title"], 
-                    status=config["id"], 
-                    color=color
-                )
-                
-                # Connect signals
-                column.taskDropped.connect(self.onTaskDropped)
-                column.taskReordered.connect(self.onTaskReordered)
-                column.taskDoubleClicked.connect(self.editTask)
-                column.taskAdded.connect(self.addTask)
-                column.columnMoved.connect(self.onColumnMoved)
-                
-                # Set a fixed minimum width for more consistent layout
-                column.setMinimumWidth(250)
-                
-                # Add to layout with stretch factor
-                self.columns_layout.addWidget(column, 1)
-                self.columns[config["id"]] = column
-                
-            # Add stretch at the end to prevent columns from expanding too wide
-            self.columns_layout.addStretch(0)
-                
-            # Load tasks after creating columns
-            if hasattr(self, 'tasks'):
-                self.loadTasks()
-                
-            # Update task counts for all columns
-            for column in self.columns.values():
-                if hasattr(column, 'updateTaskCount'):
-                    column.updateTaskCount()
-                    
-        except Exception as e:
-            import traceback
-            print(f"Error creating columns: {e}")
-            traceback.print_exc()
+            # Handle old configuration format (dictionary with key-value pairs)
+            if isinstance(kanban_config, dict):
+                # Convert old format to new format
+                column_configs = [{"id": column_id, "title": kanban_config[column_id]} for column_id in kanban_config]
+            # Handle new configuration format (list of objects)
+            elif isinstance(kanban_config, list):
+                column_configs = kanban_config
+        
+        # If no valid configuration (empty list or none), use defaults
+        if not column_configs:
+            column_configs = [dict(config) for config in self.DEFAULT_COLUMNS]
+        
+        self._config_cache = column_configs
+        return column_configs
     
-    def loadTasks(self):
-        """Load tasks into columns."""
-        # Get tasks for the program
-        tasks = self.db.get_tasks_by_program(self.program_id)
+    def _saveKanbanConfig(self, column_configs):
+        """Save the program's kanban column configuration and cache the saved copy.
         
-        # Store current task versions for concurrency control
-        self.task_versions = {task.id: task.version for task in tasks}
+        Tasks in a column that no longer exists are moved to the first column
+        in the same transaction.
         
-        # Group tasks by status
-        tasks_by_status = {}
-        for task in tasks:
-            if task.status not in tasks_by_status:
-                tasks_by_status[task.status] = []
-            tasks_by_status[task.status].append(task)
-        
-        # Clear existing tasks in columns
-        for column in self.columns.values():
-            for i in reversed(range(column.tasks_layout.count())):
-                item = column.tasks_layout.itemAt(i)
-                if item.widget():
-                    item.widget().setParent(None)
-        
-        # Add tasks to columns
-        for status, column in self.columns.items():
-            if status in tasks_by_status:
-                # Sort tasks by order_index
-                status_tasks = sorted(tasks_by_status[status], key=lambda t: t.order_index)
-                for task in status_tasks:
-                    task_widget = TaskWidget(task, parent=column)
-                    # Connect the edit and delete signals
-                    task_widget.edit_clicked.connect(self.editTask)
-                    task_widget.delete_clicked.connect(self.deleteTask)
-                    task_widget.doubleClicked.connect(self.editTask)
-                    column.tasks_layout.addWidget(task_widget)
-                    
-        # Add spacer at the end of each column for proper spacing
-        for column in self.columns.values():
-            spacer = QWidget()
-            from PyQt5.QtWidgets import QSizePolicy
-            spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-            column.tasks_layout.addWidget(spacer)
+        Returns:
+            bool: True if the configuration was saved
+        """
+        self._config_cache = None
+        self._flushStatusUpdates()
+        try:
+            with self.db.transaction():
+                saved = self.db.save_program_kanban_config(self.program_id, column_configs)
+                if saved and column_configs:
+                    # Move tasks that are in a column that no longer exists to the first column
+                    existing_column_ids = [config["id"] for config in column_configs]
+                    if self.db.move_orphaned_tasks(self.program_id, existing_column_ids,
+                                                   column_configs[0]["id"]):
+                        self._invalidateTasksCache()
+            if saved:
+                # No need to read back what was just written; configurations
+                # are flat dicts, so copying each one is enough
+                self._config_cache = [dict(config) for config in column_configs]
+            return saved
+        except Exception:
+            logger.exception("Error saving column config")
+            self._invalidateTasksCache()
+            return False
+    
+    def hideEvent(self, event):
+        """Write pending task moves when the board is hidden or closed."""
+        self._flushStatusUpdates()
+        super().hideEvent(event)
+
+    def taskWidget(self, task_id):
+        """Return the TaskWidget showing the given task, or None."""
+        return self._widget_index.get(task_id)
     
     def checkForUpdates(self):
         """Periodically check for updates to the kanban board."""
         # Only check if the widget is visible
         if not self.isVisible():
             return
+        
+        # A reload or fetch is already on its way
+        if self._refresh_pending or self._tasks_fetcher is not None:
+            return
+        
+        self._flushStatusUpdates()
+        
+        # Skip fetching the tasks when nothing changed since the last check
+        board_rev = self.db.get_program_board_revision(self.program_id)
+        if board_rev is not None and board_rev == self._last_board_rev:
+            return
+        self._last_board_rev = board_rev
             
-        # Get current tasks from database
-        current_tasks = self.db.get_tasks_by_program(self.program_id)
-        
-        # Extract tasks versions from database
-        db_task_versions = {task.id: task.version for task in current_tasks}
-        
-        # Check for differences in versions
-        needs_refresh = False
-        
-        # Look for tasks that were updated
-        for task_id, db_version in db_task_versions.items():
-            if task_id in self.task_versions:
-                # Task exists in our local cache
-                if db_version > self.task_versions[task_id]:
-                    # Task was updated by another user
-                    needs_refresh = True
-                    break
-            else:
-                # New task was added
-                needs_refresh = True
-                break
-                
-        # Look for tasks that were deleted
-        for task_id in self.task_versions:
-            if task_id not in db_task_versions:
-                # Task was deleted
-                needs_refresh = True
-                break
+        # Get current tasks from database; _onTasksFetched compares them and
+        # a resulting reload reuses the fetch
+        self._check_waiting = True
+        self._invalidateTasksCache()
+        self._fetchTasks()
+    
+    def _tasksChanged(self, current_tasks):
+        """Check whether tasks were added, updated or deleted since the last load.
         
-        # Refresh if needed
-        if needs_refresh:
-            self.refreshRequired.emit()
-            self.loadTasks()
+        Args:
+            current_tasks: The program's tasks as now in the database
+        """
+        # task_versions follows every change made on this board, so any
+        # difference was made elsewhere; the dicts compare in C
+        return {task.id: task.version for task in current_tasks} != self.task_versions
+    
+    def _showStatusMessage(self, message, timeout=3000):
+        """Show a message in the main window's status bar without blocking.
+        
+        Args:
+            message: Text to show
+            timeout: Milliseconds before the message is cleared
+        """
+        window = self.window()
+        if hasattr(window, 'statusBar'):
+            window.statusBar().showMessage(message, timeout)
+        else:
+            print(message)
     
     def addTask(self, status):
         """Add a new task to the specified column."""
@@ -1005,27 +1702,40 @@ class KanbanBoard(QWidget):
                 priority=task_data["priority"],
                 color=task_data["color"]
             )
+            self._flushStatusUpdates()
             self.db.add_task(task)
+            if self._tasks_cache is not None:
+                # Cache the row as inserted, with the creation time the
+                # database gave it; it comes last in its column, as in a
+                # fresh fetch
+                added = self.db.get_task_by_id(task.id)
+                if added is not None:
+                    self._tasks_cache.append(added)
+                else:
+                    self._invalidateTasksCache()
             self.loadTasks()
     
     def editTask(self, task):
         """Edit an existing task with concurrency control."""
+        self._flushStatusUpdates()
+        
         # Check if the task version is current before editing
         current_task = self.db.get_task_by_id(task.id)
         if not current_task:
             QMessageBox.warning(self, "Task Not Found", 
                                f"The task '{task.name}' no longer exists and may have been deleted by another user.")
-            self.loadTasks()
+            self.refresh()
             return
         
         # Check for version conflict
         if current_task.version > task.version:
             # Task was modified by another user
+            self._invalidateTasksCache()
             if self.conflict_resolution_mode == "last_wins":
                 # Silently reload with the latest version
                 self.loadTasks()
-                QMessageBox.information(self, "Task Updated", 
-                                       f"Task '{task.name}' was updated by another user. The latest version will be shown.")
+                self._showStatusMessage(
+                    f"Task '{task.name}' was updated by another user. The latest version is shown.")
                 # Try to edit again with the latest version
                 self.editTask(current_task)
                 return
@@ -1066,33 +1776,41 @@ class KanbanBoard(QWidget):
             task.color = task_data["color"]
             
             # Update with version checking
-            result = self.db.update_task(task, expected_version=task.version)
+            success, conflict_data = self.db.update_task(task, expected_version=task.version)
             
-            if isinstance(result, dict) and result.get('conflict', False):
+            if not success:
                 QMessageBox.warning(self, "Update Conflict", 
                                    "The task was modified by another user while you were editing. Your changes were not saved.")
-                self.loadTasks()
-            elif result:
-                # Update local version if successful
-                if isinstance(result, dict) and 'new_version' in result:
-                    self.task_versions[task.id] = result['new_version']
-                self.loadTasks()
+                self.refresh()
+            else:
+                # update_task bumped task.version; put the task in the cache
+                # in place of its old copy so no fetch is needed
+                self.task_versions[task.id] = task.version
+                self._replaceCachedTask(task)
+                task_widget = self.taskWidget(task.id)
+                if task_widget is not None and task_widget.task is task:
+                    # Only this card changed; the columns need no sync
+                    task_widget.updateFrom(task)
+                else:
+                    self.loadTasks()
     
     def deleteTask(self, task):
         """Delete an existing task with concurrency control."""
+        self._flushStatusUpdates()
+        
         # Check if the task version is current before deleting
         current_task = self.db.get_task_by_id(task.id)
         if not current_task:
             QMessageBox.warning(self, "Task Not Found", 
                                f"The task '{task.name}' no longer exists and may have been deleted by another user.")
-            self.loadTasks()
+            self.refresh()
             return
             
         # Check for version conflict
         if current_task.version > task.version:
             QMessageBox.warning(self, "Task Modified", 
                                f"Task '{task.name}' has been modified by another user. Please refresh and try again.")
-            self.loadTasks()
+            self.refresh()
             return
             
         reply = QMessageBox.question(self, "Confirm Delete", 
@@ -1102,20 +1820,40 @@ class KanbanBoard(QWidget):
         if reply == QMessageBox.Yes:
             result = self.db.delete_task(task.id)
             if result:
-                # Remove from version tracking
+                # Remove from version tracking and the task cache
                 if task.id in self.task_versions:
                     del self.task_versions[task.id]
-                self.loadTasks()
+                if self._tasks_cache is not None:
+                    self._tasks_cache = [t for t in self._tasks_cache if t.id != task.id]
+                self._removeTaskLocally(task)
+    
+    def _removeTaskLocally(self, task):
+        """Remove a deleted task's card from its column without a reload."""
+        default_col = next(iter(self.columns.values()), None)
+        column = self.columns.get(task.status, default_col)
+        if column is None or not any(t.id == task.id for t in column.tasks):
+            self.loadTasks()
+            return
+        
+        column.tasks = [t for t in column.tasks if t.id != task.id]
+        with _updatesSuspended(column):
+            self._discardTaskWidget(task.id)
+            # A task beyond the loaded batch may move up into it
+            self._syncColumn(column)
     
     def onTaskDropped(self, task_id, new_status):
         """Handle a task being dropped in a new column (status change).
         
+        The card moves at once. The new status is written together with any
+        other drops made within STATUS_FLUSH_DELAY milliseconds.
+        
         Args:
             task_id: ID of the task being moved
             new_status: New status (column) for the task
         """
         # Get the task object
-        task = self.db.get_task_by_id(task_id)
+        task_widget = self.taskWidget(task_id)
+        task = task_widget.task if task_widget else self.db.get_task_by_id(task_id)
         if not task:
             print(f"Error: Task with ID {task_id} not found")
             return
@@ -1124,25 +1862,98 @@ class KanbanBoard(QWidget):
         if old_status == new_status:
             # No change in status
             return
-            
-        # Update the task status with version checking
-        result = self.db.update_task_status(task_id, new_status, expected_version=task.version)
-        success, conflict_data = result
         
-        if not success:
+        # A task dropped again before the write keeps the version it was first
+        # dropped with, so changes by other users in between are still detected
+        expected_version = self._pending_status.get(task_id, (None, task.version))[1]
+        self._pending_status[task_id] = (new_status, expected_version)
+        self._status_flush_timer.start()
+        
+        # Cards keep the task they were last synced with, so move a copy
+        moved_task = copy.copy(task)
+        moved_task.status = new_status
+        self._invalidateTasksCache()
+        self._moveTaskLocally(moved_task, old_status)
+    
+    def _flushStatusUpdates(self):
+        """Write the pending status changes of dropped tasks in one transaction."""
+        self._status_flush_timer.stop()
+        if not self._pending_status:
+            return
+        pending, self._pending_status = self._pending_status, {}
+        
+        conflict = False
+        try:
+            with self.db.transaction():
+                for task_id, (new_status, expected_version) in pending.items():
+                    # Update the task status with version checking
+                    success, result = self.db.update_task_status(
+                        task_id, new_status, expected_version=expected_version)
+                    if success:
+                        updated_task = result["updated_task"]
+                        self.task_versions[task_id] = updated_task.version
+                        
+                        # The moved copy on the board now matches the database
+                        column = self.columns.get(new_status)
+                        for column_task in column.tasks if column else ():
+                            if column_task.id == task_id:
+                                column_task.version = updated_task.version
+                                column_task.modified_at = updated_task.modified_at
+                    else:
+                        conflict = True
+        except Exception as e:
+            print(f"Error saving task moves: {e}")
+            conflict = True
+        
+        if conflict:
             # Handle conflict based on conflict resolution mode
             if self.conflict_resolution_mode == "manual":
                 self._showConflictDialog("The task has been modified by another user.", 
                                          "Would you like to override their changes?")
             # In "last_writer_wins" mode, we'll refresh the board which will show the latest state
+            
+            # Reload the tasks to reflect any changes
+            self.refresh()
+    
+    def _moveTaskLocally(self, task, old_status):
+        """Move a task's card to the column of its new status without a reload.
         
-        # Reload the tasks to reflect any changes
-        self.loadTasks()
+        Args:
+            task: The updated task
+            old_status: Status the task had before the move
+        """
+        default_col = next(iter(self.columns.values()), None)
+        old_column = self.columns.get(old_status, default_col)
+        new_column = self.columns.get(task.status, default_col)
+        if new_column is None:
+            return
+        
+        if old_column is not None:
+            old_column.tasks = [t for t in old_column.tasks if t.id != task.id]
+        new_column.tasks = sorted(
+            [t for t in new_column.tasks if t.id != task.id] + [task],
+            key=self._taskOrderKey)
+        
+        # Both columns change; paint them together once
+        with _updatesSuspended(self):
+            shown_ids = self._syncColumn(new_column)
+            if task.id not in shown_ids:
+                # The task landed beyond the loaded batch of its new column
+                self._discardTaskWidget(task.id)
+            
+            if old_column is not None and old_column is not new_column:
+                self._syncColumn(old_column)
     
     def onTaskReordered(self, task_id, new_position):
         """Update task order when reordered within a column with concurrency control."""
-        # Get current task version
-        task = self.db.get_task_by_id(task_id)
+        # The database must know the task's column before renumbering it
+        self._flushStatusUpdates()
+        
+        # The card holds the task with the version this board last saw, so
+        # reorder_tasks detects changes made by other users since
+        task_widget = self.taskWidget(task_id)
+        task = task_widget.task if task_widget else self.db.get_task_by_id(task_id)
+        self._invalidateTasksCache()
         if not task:
             QMessageBox.warning(self, "Task Not Found", 
                               "The task no longer exists and may have been deleted by another user.")
@@ -1153,7 +1964,14 @@ class KanbanBoard(QWidget):
         result = self.db.reorder_tasks(task_id, new_position, expected_version=task.version)
         success, conflict_data = result
         
-        if not success:
+        if success:
+            # Apply the same reordering to the column instead of reloading
+            if self._reorderTaskLocally(task, new_position):
+                return
+        elif conflict_data.get("error") == "Task not found":
+            QMessageBox.warning(self, "Task Not Found", 
+                              "The task no longer exists and may have been deleted by another user.")
+        else:
             # Handle conflict based on conflict resolution mode
             if self.conflict_resolution_mode == "manual":
                 QMessageBox.warning(self, "Update Conflict", 
@@ -1163,36 +1981,47 @@ class KanbanBoard(QWidget):
         # Reload the tasks to reflect any changes
         self.loadTasks()
     
+    def _reorderTaskLocally(self, task, new_position):
+        """Mirror a successful Database.reorder_tasks in the task's column.
+        
+        Args:
+            task: The task as it was before the reorder
+            new_position: New position of the task within its column
+            
+        Returns:
+            bool: False if the column cannot mirror the database order (the
+            task is not shown, or the column also shows orphaned tasks), in
+            which case the board needs a reload
+        """
+        column = self.columns.get(task.status)
+        if column is None or any(t.status != column.status for t in column.tasks):
+            return False
+        
+        column_tasks = column.tasks
+        moved = next((t for t in column_tasks if t.id == task.id), None)
+        if moved is None:
+            return False
+        
+        # reorder_tasks renumbers the whole column and bumps the moved task's version
+        column_tasks.remove(moved)
+        column_tasks.insert(new_position, moved)
+        for index, column_task in enumerate(column_tasks):
+            column_task.order_index = index
+        moved.version = task.version + 1
+        self.task_versions[moved.id] = moved.version
+        
+        self._syncColumn(column)
+        return True
+    
     def onColumnMoved(self, column_id, new_position):
         """Update column order when a column is moved."""
-        print(f"onColumnMoved called: {column_id} -> position {new_position}")
+        logger.debug("onColumnMoved called: %s -> position %d", column_id, new_position)
         
         # Get the program-specific column configuration
-        column_configs = self.db.get_program_kanban_config(self.program_id)
-        
-        # If no program-specific config exists, get from global config
-        if column_configs is None:
-            # Get column configuration from general settings
-            kanban_config = self.config.value("kanban_columns", [])
-            
-            # Handle old configuration format (dictionary with key-value pairs)
-            if isinstance(kanban_config, dict):
-                # Convert old format to new format
-                column_configs = [{"id": column_id, "title": kanban_config[column_id]} for column_id in kanban_config]
-            # Handle new configuration format (list of objects)
-            elif isinstance(kanban_config, list):
-                column_configs = kanban_config
-            
-            # If no valid configuration, use defaults
-            if not column_configs:
-                column_configs = [
-                    {"id": "todo", "title": "To Do", "color": "#f0f7ff"},         # Light blue for To Do
-                    {"id": "in_progress", "title": "In Progress", "color": "#fff7e6"}, # Light orange for In Progress
-                    {"id": "done", "title": "Done", "color": "#f0fff5"}           # Light green for Done
-                ]
+        column_configs = list(self._getKanbanConfig())
         
-        # Print current configuration for debugging
-        print(f"Current column configs before move: {column_configs}")
+        # Log current configuration for debugging
+        logger.debug("Current column configs before move: %s", column_configs)
         
         # Find the column to move
         column_to_move = None
@@ -1205,7 +2034,7 @@ class KanbanBoard(QWidget):
                 break
         
         if column_to_move is None:
-            print(f"Error: Column with ID {column_id} not found in configuration")
+            logger.error("Column with ID %s not found in configuration", column_id)
             return
             
         # Adjust new_position if it's invalid
@@ -1220,33 +2049,17 @@ class KanbanBoard(QWidget):
         # Insert it at the new position
         column_configs.insert(new_position, column_to_move)
         
-        print(f"New column configs after move: {column_configs}")
+        logger.debug("New column configs after move: %s", column_configs)
         
         # Save the updated program-specific configuration
         try:
-            result = self.db.save_program_kanban_config(self.program_id, column_configs)
-            print(f"Save result: {result}")
-        except Exception as e:
-            print(f"Error saving column config: {e}")
+            result = self._saveKanbanConfig(column_configs)
+            logger.debug("Save result: %s", result)
+        except Exception:
+            logger.exception("Error saving column config")
         
-        # Update the column titles in the UI
+        # Move the column in the UI; tasks are reloaded only if placement changes
         self.createColumns()
-        self.loadTasks()
-        
-        # Handle tasks in deleted columns
-        # Move them to the first column if they were in a deleted column
-        if column_configs:
-            first_column_id = column_configs[0]["id"]
-            existing_column_ids = [config["id"] for config in column_configs]
-            
-            # Get all tasks for this program
-            program_tasks = self.db.get_tasks_by_program(self.program_id)
-            
-            # Find tasks that are in a column that no longer exists
-            for task in program_tasks:
-                if task.status not in existing_column_ids:
-                    # Move task to first column
-                    self.db.update_task_status(task.id, first_column_id)
         
     def setConflictResolutionMode(self, mode):
         """Set the conflict resolution mode.
@@ -1257,52 +2070,72 @@ class KanbanBoard(QWidget):
         if mode in ["last_wins", "manual_resolution"]:
             self.conflict_resolution_mode = mode
     
+    def setRefreshInterval(self, interval):
+        """Set how often the board checks for changes made by other users.
+        
+        Args:
+            interval (int): Interval in milliseconds, at least
+                MIN_REFRESH_INTERVAL; 0 disables auto-refresh
+        """
+        if interval <= 0:
+            self.refresh_interval = 0
+            self.refresh_timer.stop()
+            return
+        
+        self.refresh_interval = max(interval, self.MIN_REFRESH_INTERVAL)
+        # Starting the timer restarts it, so leave a running one alone
+        if not self.refresh_timer.isActive() or self.refresh_timer.interval() != self.refresh_interval:
+            self.refresh_timer.start(self.refresh_interval)
+    
     def customizeColumns(self):
-        """Open a dialog to customize kanban board columns."""
+        """Open a dialog to customize kanban board columns.
+        
+        The dialog is built once per board; each opening only fills it with
+        the current column configuration and settings.
+        """
+        dialog = self._customize_dialog
+        if dialog is None:
+            dialog = self._customize_dialog = self._createCustomizeDialog()
+        
+        # Drop the rows of the last opening; their edits were saved or cancelled
+        for widgets in dialog.column_widgets.values():
+            row_widget = widgets["row_widget"]
+            dialog.columns_layout.removeWidget(row_widget)
+            row_widget.hide()
+            row_widget.deleteLater()
+        
+        # Work on a copy of the column configs and add a row for each column
+        dialog.column_configs = [dict(config) for config in self._getKanbanConfig()]
+        dialog.column_widgets = {}
+        for config in dialog.column_configs:
+            self._addColumnRow(config, dialog.column_configs, dialog.column_widgets, dialog.columns_layout)
+        
+        # Show the current settings
+        current_mode_index = 0  # default to last_wins
+        if self.conflict_resolution_mode == "manual_resolution":
+            current_mode_index = 1
+        dialog.conflict_mode_combo.setCurrentIndex(current_mode_index)
+        dialog.refresh_interval_spinner.setValue(int(self.refresh_interval / 1000))
+        dialog.tab_widget.setCurrentIndex(0)
+        
+        dialog.exec_()
+    
+    def _createCustomizeDialog(self):
+        """Build the column customization dialog; customizeColumns fills it in."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Customize Kanban Board")
         dialog.setMinimumWidth(700)  # Increased from 500
         dialog.setMinimumHeight(500)  # Added minimum height
         
         # Apply styling to the dialog
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fb;
-            }
-            QLabel {
-                font-family: 'Segoe UI';
-                font-size: 11pt;
-                color: #2c3e50;
-            }
-            QLineEdit, QComboBox, QSpinBox {
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                font-family: 'Segoe UI';
-                font-size: 10pt;
-                color: #2c3e50;
-                selection-background-color: #3498db;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #3498db;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 0px;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }
-        """)
+        dialog.setStyleSheet(_DIALOG_STYLESHEET)
         
         # Main layout for the dialog
         main_layout = QVBoxLayout(dialog)
         
-        # Get current column configs
-        column_configs = self.db.get_program_kanban_config(self.program_id)
-        column_configs_copy = copy.deepcopy(column_configs)  # Make a copy to work with
+        # Column configs being edited and their rows, by column ID in dialog order
+        dialog.column_configs = []
+        dialog.column_widgets = {}
         
         # Tab widget for different settings
         tab_widget = QTabWidget()
@@ -1322,59 +2155,11 @@ class KanbanBoard(QWidget):
         scroll.setWidget(container)
         columns_tab_layout.addWidget(scroll)
         
-        # Store column widgets for later reference
-        column_widgets = []
-        
-        # Add existing columns to the dialog
-        for i, config in enumerate(column_configs_copy):
-            row_layout = QHBoxLayout()
-            
-            # Column ID (hidden from user but used for tracking)
-            id_label = QLabel(f"ID: {config['id']}")
-            id_label.setVisible(False)  # Hide the ID
-            row_layout.addWidget(id_label)
-            
-            # Column title
-            title_label = QLabel("Title:")
-            row_layout.addWidget(title_label)
-            
-            title_edit = QLineEdit(config["title"])
-            title_edit.setMinimumWidth(150)  # Make title edit wider
-            row_layout.addWidget(title_edit)
-            
-            # Column color picker
-            color_label = QLabel("Color:")
-            row_layout.addWidget(color_label)
-            
-            column_color = config.get("color", "#f0f0f0")
-            color_button = QPushButton()
-            color_button.setFixedSize(24, 24)
-            color_button.setStyleSheet(f"""
-                background-color: {column_color};
-                border: 1px solid #cccccc;
-            """)
-            color_button.clicked.connect(lambda checked, btn=color_button, widget_idx=len(column_widgets): 
-                                         self.selectColumnColor(btn, widget_idx, column_widgets))
-            row_layout.addWidget(color_button)
-            
-            # Delete button (only if we have more than the minimum required columns)
-            delete_btn = QPushButton("Delete")
-            delete_btn.setEnabled(len(column_configs_copy) > 3)  # Ensure minimum of 3 columns
-            delete_btn.clicked.connect(lambda checked, idx=i: self.deleteColumnFromCustomizeDialog(idx, column_configs_copy, column_widgets, columns_layout))
-            row_layout.addWidget(delete_btn)
-            
-            columns_layout.addLayout(row_layout)
-            
-            column_widgets.append({
-                "id": config["id"],
-                "title_edit": title_edit,
-                "color_button": color_button
-            })
-        
         # Add "Add Column" button
         add_column_layout = QHBoxLayout()
         add_column_btn = QPushButton("Add Column")
-        add_column_btn.clicked.connect(lambda: self.addColumnFromCustomizeDialog(column_configs_copy, column_widgets, columns_layout))
+        add_column_btn.clicked.connect(lambda: self.addColumnFromCustomizeDialog(
+            dialog.column_configs, dialog.column_widgets, columns_layout))
         add_column_layout.addWidget(add_column_btn)
         columns_tab_layout.addLayout(add_column_layout)
         
@@ -1395,12 +2180,6 @@ class KanbanBoard(QWidget):
         conflict_mode_combo.addItem("Last Writer Wins (Automatic)", "last_wins")
         conflict_mode_combo.addItem("Manual Resolution (Ask User)", "manual_resolution")
         
-        # Set current value
-        current_mode_index = 0  # default to last_wins
-        if self.conflict_resolution_mode == "manual_resolution":
-            current_mode_index = 1
-        conflict_mode_combo.setCurrentIndex(current_mode_index)
-        
         conflict_mode_layout.addWidget(conflict_mode_combo)
         concurrency_layout.addLayout(conflict_mode_layout)
         
@@ -1421,9 +2200,12 @@ class KanbanBoard(QWidget):
         refresh_layout.addWidget(refresh_label)
         
         refresh_interval_spinner = QSpinBox()
-        refresh_interval_spinner.setMinimum(1)
+        refresh_interval_spinner.setMinimum(0)
         refresh_interval_spinner.setMaximum(60)
-        refresh_interval_spinner.setValue(int(self.refresh_timer.interval() / 1000))
+        refresh_interval_spinner.setSpecialValueText("Off")
+        refresh_interval_spinner.setToolTip(
+            f"0 disables auto-refresh; shorter intervals than "
+            f"{self.MIN_REFRESH_INTERVAL // 1000} seconds are raised to it")
         refresh_layout.addWidget(refresh_interval_spinner)
         
         concurrency_layout.addLayout(refresh_layout)
@@ -1436,88 +2218,36 @@ class KanbanBoard(QWidget):
         
         # Add OK and Cancel buttons
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(lambda: self.saveColumnCustomizations(dialog, column_configs_copy, column_widgets, conflict_mode_combo, refresh_interval_spinner))
+        button_box.accepted.connect(lambda: self.saveColumnCustomizations(
+            dialog, dialog.column_configs, dialog.column_widgets, conflict_mode_combo, refresh_interval_spinner))
         button_box.rejected.connect(dialog.reject)
         main_layout.addWidget(button_box)
         
-        dialog.exec_()
-    
-    def selectColumnColor(self, color_button, widget_idx, column_widgets):
-        """Select a color for the column."""
-        color = QColorDialog.getColor()
-        if color.isValid():
-            column_widgets[widget_idx]["color_button"].setStyleSheet(f"""
-                background-color: {color.name()};
-                border: 1px solid #cccccc;
-            """)
+        # Controls customizeColumns fills in on each opening
+        dialog.tab_widget = tab_widget
+        dialog.columns_layout = columns_layout
+        dialog.conflict_mode_combo = conflict_mode_combo
+        dialog.refresh_interval_spinner = refresh_interval_spinner
+        return dialog
     
-    def saveColumnCustomizations(self, dialog, column_configs, column_widgets, conflict_mode_combo=None, refresh_interval_spinner=None):
-        """Save column customizations from the dialog.
+    def _addColumnRow(self, config, column_configs, column_widgets, columns_layout):
+        """Add the row editing a column to the column customization dialog.
         
         Args:
-            dialog: The dialog to close after saving
+            config: Configuration of the column
             column_configs: List of column configurations
-            column_widgets: List of column widget references
-            conflict_mode_combo: Conflict resolution mode dropdown
-            refresh_interval_spinner: Auto-refresh interval spinner
+            column_widgets: Column widget references by column ID
+            columns_layout: Layout containing the column rows
         """
-        # Update column titles from the input fields
-        for i, config in enumerate(column_configs):
-            if i < len(column_widgets):
-                config["title"] = column_widgets[i]["title_edit"].text()
-                config["color"] = column_widgets[i]["color_button"].styleSheet().split(":")[1].strip()
-        
-        # Save the updated configuration to the database
-        self.db.save_program_kanban_config(self.program_id, column_configs)
-        
-        # Update conflict resolution mode if provided
-        if conflict_mode_combo:
-            new_mode = conflict_mode_combo.currentData()
-            self.setConflictResolutionMode(new_mode)
-        
-        # Update refresh interval if provided
-        if refresh_interval_spinner:
-            new_interval = refresh_interval_spinner.value() * 1000  # convert to milliseconds
-            self.refresh_timer.setInterval(new_interval)
-        
-        # Recreate columns with the updated configuration
-        self.createColumns()
-        
-        # Reload tasks
-        self.loadTasks()
-        
-        # Handle tasks in deleted columns
-        # Move them to the first column if they were in a deleted column
-        if column_configs:
-            first_column_id = column_configs[0]["id"]
-            existing_column_ids = [config["id"] for config in column_configs]
-            
-            # Get all tasks for this program
-            program_tasks = self.db.get_tasks_by_program(self.program_id)
-            
-            # Find tasks that are in a column that no longer exists
-            for task in program_tasks:
-                if task.status not in existing_column_ids:
-                    # Move task to first column
-                    self.db.update_task_status(task.id, first_column_id)
-        
-        # Close the dialog
-        dialog.accept()
-        
-    def addColumnFromCustomizeDialog(self, column_configs, column_widgets, columns_layout):
-        """Add a new column from the column customization dialog."""
-        # Create a new column configuration
-        new_column_id = f"column_{len(column_configs) + 1}"
-        new_column_title = f"Column {len(column_configs) + 1}"
+        column_id = config["id"]
         
-        # Add the new column configuration to the list
-        column_configs.append({"id": new_column_id, "title": new_column_title})
-        
-        # Create a new row for the column configuration
-        row_layout = QHBoxLayout()
+        # The row's widgets live in one container so the row is deleted at once
+        row_widget = QWidget()
+        row_layout = QHBoxLayout(row_widget)
+        row_layout.setContentsMargins(0, 0, 0, 0)
         
         # Column ID (hidden from user but used for tracking)
-        id_label = QLabel(f"ID: {new_column_id}")
+        id_label = QLabel(f"ID: {column_id}")
         id_label.setVisible(False)  # Hide the ID
         row_layout.addWidget(id_label)
         
@@ -1525,7 +2255,7 @@ class KanbanBoard(QWidget):
         title_label = QLabel("Title:")
         row_layout.addWidget(title_label)
         
-        title_edit = QLineEdit(new_column_title)
+        title_edit = QLineEdit(config["title"])
         title_edit.setMinimumWidth(150)  # Make title edit wider
         row_layout.addWidget(title_edit)
         
@@ -1533,85 +2263,123 @@ class KanbanBoard(QWidget):
         color_label = QLabel("Color:")
         row_layout.addWidget(color_label)
         
+        column_color = self._columnColor(config)
         color_button = QPushButton()
         color_button.setFixedSize(24, 24)
-        color_button.setStyleSheet("background-color: #f0f0f0; border: 1px solid #cccccc;")
-        color_button.clicked.connect(lambda checked, btn=color_button, widget_idx=len(column_widgets): 
-                                     self.selectColumnColor(btn, widget_idx, column_widgets))
+        color_button.setStyleSheet(f"background-color: {column_color}; border: 1px solid #cccccc;")
+        color_button.clicked.connect(lambda checked: self.selectColumnColor(column_id, column_widgets))
         row_layout.addWidget(color_button)
         
-        # Delete button
+        # Delete button (only if we have more than the minimum required columns)
         delete_btn = QPushButton("Delete")
-        delete_btn.clicked.connect(lambda checked, idx=len(column_configs) - 1: self.deleteColumnFromCustomizeDialog(idx, column_configs, column_widgets, columns_layout))
+        delete_btn.setEnabled(len(column_configs) > 3)  # Ensure minimum of 3 columns
+        delete_btn.clicked.connect(lambda checked: self.deleteColumnFromCustomizeDialog(
+            column_id, column_configs, column_widgets, columns_layout))
         row_layout.addWidget(delete_btn)
         
-        columns_layout.addLayout(row_layout)
+        columns_layout.addWidget(row_widget)
         
-        column_widgets.append({
-            "id": new_column_id,
+        column_widgets[column_id] = {
+            "row_widget": row_widget,
             "title_edit": title_edit,
-            "color_button": color_button
-        })
+            "color_button": color_button,
+            "color": column_color
+        }
+    
+    def selectColumnColor(self, column_id, column_widgets):
+        """Select a color for the column."""
+        widgets = column_widgets[column_id]
+        color = QColorDialog.getColor(initial=QColor(widgets["color"]))
+        # The swatch is restyled once the dialog closes, and only for a new color
+        if color.isValid() and color.name() != widgets["color"]:
+            widgets["color"] = color.name()
+            widgets["color_button"].setStyleSheet(
+                f"background-color: {color.name()}; border: 1px solid #cccccc;")
     
-    def deleteColumnFromCustomizeDialog(self, index, column_configs, column_widgets, columns_layout):
+    def saveColumnCustomizations(self, dialog, column_configs, column_widgets, conflict_mode_combo=None, refresh_interval_spinner=None):
+        """Save column customizations from the dialog.
+        
+        Args:
+            dialog: The dialog to close after saving
+            column_configs: List of column configurations
+            column_widgets: Column widget references by column ID
+            conflict_mode_combo: Conflict resolution mode dropdown
+            refresh_interval_spinner: Auto-refresh interval spinner
+        """
+        # Update column titles and colors from the dialog rows; a color left
+        # at the column's default stays unset, as it was loaded
+        for config in column_configs:
+            widgets = column_widgets.get(config["id"])
+            if widgets:
+                config["title"] = widgets["title_edit"].text()
+                if widgets["color"] != self._columnColor(config):
+                    config["color"] = widgets["color"]
+        
+        # Save the updated configuration to the database, unless the dialog
+        # was closed without editing the columns
+        columns_changed = column_configs != self._getKanbanConfig()
+        if columns_changed:
+            self._saveKanbanConfig(column_configs)
+        
+        # Update conflict resolution mode if provided
+        if conflict_mode_combo:
+            new_mode = conflict_mode_combo.currentData()
+            self.setConflictResolutionMode(new_mode)
+        
+        # Update refresh interval if provided
+        if refresh_interval_spinner:
+            self.setRefreshInterval(refresh_interval_spinner.value() * 1000)  # convert to milliseconds
+        
+        # Update the columns in place; task widgets of kept columns are reused
+        if columns_changed:
+            self._updateColumns(column_configs)
+        
+        # Close the dialog
+        dialog.accept()
+        
+    def addColumnFromCustomizeDialog(self, column_configs, column_widgets, columns_layout):
+        """Add a new column from the column customization dialog."""
+        # Create a new column configuration with an unused ID
+        number = len(column_configs) + 1
+        while f"column_{number}" in column_widgets:
+            number += 1
+        config = {"id": f"column_{number}", "title": f"Column {number}"}
+        
+        # Add the new column configuration to the list and give it a row
+        column_configs.append(config)
+        self._addColumnRow(config, column_configs, column_widgets, columns_layout)
+    
+    def deleteColumnFromCustomizeDialog(self, column_id, column_configs, column_widgets, columns_layout):
         """Delete a column from the kanban board.
         
         Args:
-            index: Index of the column to delete
+            column_id: ID of the column to delete
             column_configs: List of column configurations
-            column_widgets: List of column widget references
-            columns_layout: Layout containing the column widgets
+            column_widgets: Column widget references by column ID
+            columns_layout: Layout containing the column rows
         """
         # Check if we have enough columns to delete one
         if len(column_configs) <= 3:
             QMessageBox.warning(self, "Cannot Delete Column", 
                               "You must have at least 3 columns in your Kanban board.")
             return
+        
+        config = next(config for config in column_configs if config["id"] == column_id)
             
         # Confirm with user
         confirm = QMessageBox.question(self, "Confirm Delete", 
-                                     f"Are you sure you want to delete the column '{column_configs[index]['title']}'?\n\n"
+                                     f"Are you sure you want to delete the column '{config['title']}'?\n\n"
                                      "Any tasks in this column will be moved to the first column.",
                                      QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         
         if confirm == QMessageBox.Yes:
-            # Remove the column from the configuration list
-            column_configs.pop(index)
-            
-            # Remove the corresponding widget from the list
-            if index < len(column_widgets):
-                column_widgets.pop(index)
-            
-            # Find and remove the corresponding row from the dialog layout
-            # The row should be at the same index as the column in the config
-            # But we need to account for the Add Column button at the end
-            row_idx = index
-            row_item = columns_layout.itemAt(row_idx)
-            
-            if row_item and row_item.layout():
-                # Remove all widgets from the layout
-                row_layout = row_item.layout()
-                while row_layout.count():
-                    item = row_layout.takeAt(0)
-                    if item.widget():
-                        item.widget().deleteLater()
-                
-                # Remove the layout itself
-                columns_layout.removeItem(row_item)
-            
-            # Update "column_index" property of remaining delete buttons
-            for i in range(columns_layout.count() - 1):  # -1 to exclude the Add Column button
-                row_item = columns_layout.itemAt(i)
-                if row_item and row_item.layout():
-                    for j in range(row_item.layout().count()):
-                        widget = row_item.layout().itemAt(j).widget()
-                        if isinstance(widget, QPushButton) and widget.text() == "Delete":
-                            old_index = widget.property("column_index")
-                            if old_index is not None and old_index > index:
-                                widget.setProperty("column_index", old_index - 1)
-                                # Update the click handler
-                                widget.clicked.disconnect()
-                                widget.clicked.connect(lambda checked, idx=old_index-1: self.deleteColumnFromCustomizeDialog(idx, column_configs, column_widgets, columns_layout))
+            # Remove the column from the configuration and its row from the dialog;
+            # the other rows are keyed by column ID and need no renumbering
+            column_configs.remove(config)
+            row_widget = column_widgets.pop(column_id)["row_widget"]
+            columns_layout.removeWidget(row_widget)
+            row_widget.hide()  # Not left on screen until it is deleted
+            row_widget.deleteLater()
 
     def editProgram(self):
         """Edit the current program name."""
@@ -1626,6 +2394,9 @@ class KanbanBoard(QWidget):
         dialog.setMinimumWidth(400)  # Increased width
         dialog.setMinimumHeight(150)  # Increased height
         
+        # Styled before the controls are added, so each is polished only once
+        dialog.setStyleSheet(self.EDIT_PROGRAM_STYLESHEET)
+        
         # Create a form layout for the dialog
         layout = QVBoxLayout(dialog)
         
@@ -1633,7 +2404,7 @@ class KanbanBoard(QWidget):
         form_layout = QFormLayout()
         name_input = QLineEdit(program.name)
         name_input.setMinimumHeight(30)  # Taller input field
-        name_input.setFont(QFont("Segoe UI", 11))
+        name_input.setFont(_PROGRAM_NAME_INPUT_FONT)
         
         form_layout.addRow("Program name:", name_input)
         layout.addLayout(form_layout)
@@ -1646,37 +2417,7 @@ class KanbanBoard(QWidget):
         button_box.accepted.connect(dialog.accept)
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
-        
-        # Apply some styling to the dialog
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fb;
-            }
-            QLabel {
-                font-family: 'Segoe UI';
-                font-size: 11pt;
-                color: #2c3e50;
-            }
-            QLineEdit {
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                font-family: 'Segoe UI';
-                font-size: 11pt;
-                color: #2c3e50;
-            }
-            QPushButton {
-                padding: 8px 16px;
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+
         
         # Show the dialog and get result
         result = dialog.exec_()
@@ -1688,15 +2429,17 @@ class KanbanBoard(QWidget):
                 success = self.db.update_program(program)
                 
                 if success:
-                    # Update the tab title if this is within a tab widget
-                    parent = self.parent()
-                    if isinstance(parent, QTabWidget):
-                        index = parent.indexOf(self)
+                    # Update the tab title if this is within a tab widget; tab
+                    # pages are children of the tab widget's internal stack
+                    stack = self.parentWidget()
+                    tab_widget = stack.parentWidget() if stack else None
+                    if isinstance(tab_widget, QTabWidget):
+                        index = tab_widget.indexOf(self)
                         if index != -1:
-                            parent.setTabText(index, new_name)
+                            tab_widget.setTabText(index, new_name)
                             
                     # Update the header title
-                    self.findChild(QLabel).setText(new_name)
+                    self.program_title_label.setText(new_name)
                 else:
                     QMessageBox.warning(self, "Error", "Failed to update program name")
 
@@ -1704,47 +2447,84 @@ class KanbanBoard(QWidget):
 class TaskDialog(QDialog):
     """Dialog for adding or editing a task."""
     
+    # Styles of the dialog's controls, keyed by object name. The priority
+    # combo box's border follows its "priority" dynamic property like the
+    # task cards; only the color preview's background is set on its own.
+    STYLESHEET = _DIALOG_STYLESHEET + """
+        QLabel#dialogHeader {
+            font-size: 16pt;
+            font-weight: bold;
+            color: #2c3e50;
+            margin-bottom: 10px;
+        }
+        QComboBox#priorityCombo {
+            padding-left: 10px;
+            height: 30px;
+        }
+        QComboBox#priorityCombo[priority="High"] {
+            border-left: 6px solid #e74c3c;
+        }
+        QComboBox#priorityCombo[priority="Medium"] {
+            border-left: 6px solid #f39c12;
+        }
+        QComboBox#priorityCombo[priority="Low"] {
+            border-left: 6px solid #2ecc71;
+        }
+        QPushButton#colorPreview {
+            border: 1px solid #dcdfe6;
+            border-radius: 4px;
+        }
+        QPushButton#colorPreview:hover {
+            border: 1px solid #3498db;
+        }
+        QPushButton#chooseColorButton {
+            background-color: #3498db;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 8px 15px;
+            font-family: 'Segoe UI';
+            font-weight: bold;
+        }
+        QPushButton#chooseColorButton:hover {
+            background-color: #2980b9;
+        }
+        QPushButton#cancelButton, QPushButton#saveButton {
+            border: none;
+            border-radius: 4px;
+            padding: 10px 20px;
+            font-family: 'Segoe UI';
+            font-weight: bold;
+            min-width: 100px;
+        }
+        QPushButton#cancelButton {
+            background-color: #ecf0f1;
+            color: #2c3e50;
+        }
+        QPushButton#cancelButton:hover {
+            background-color: #d6dbdf;
+        }
+        QPushButton#saveButton {
+            background-color: #2ecc71;
+            color: white;
+        }
+        QPushButton#saveButton:hover {
+            background-color: #27ae60;
+        }
+    """
+    
     def __init__(self, task=None, parent=None):
         super().__init__(parent)
         self.task = task
         self.task_color = task.color if task and hasattr(task, 'color') and task.color else "#ffffff"
+        self._task_qcolor = QColor(self.task_color)  # Initial color of the color picker
         self.initUI()
     
     def initUI(self):
         self.setWindowTitle("Add Task" if not self.task else "Edit Task")
         self.setMinimumWidth(500)
         self.setMinimumHeight(400)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f8f9fb;
-            }
-            QLabel {
-                font-family: 'Segoe UI';
-                font-size: 11pt;
-                color: #2c3e50;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-                padding: 8px;
-                background-color: white;
-                font-family: 'Segoe UI';
-                font-size: 10pt;
-                color: #2c3e50;
-                selection-background-color: #3498db;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border-color: #3498db;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left-width: 0px;
-                border-top-right-radius: 4px;
-                border-bottom-right-radius: 4px;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
         
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(25, 25, 25, 25)
@@ -1753,12 +2533,7 @@ class TaskDialog(QDialog):
         
         # Header with title
         header_label = QLabel("Add Task" if not self.task else "Edit Task")
-        header_label.setStyleSheet("""
-            font-size: 16pt;
-            font-weight: bold;
-            color: #2c3e50;
-            margin-bottom: 10px;
-        """)
+        header_label.setObjectName("dialogHeader")
         main_layout.addWidget(header_label)
         
         # Form layout for task fields
@@ -1788,18 +2563,8 @@ class TaskDialog(QDialog):
         # Priority selection with styled combobox
         priority_label = QLabel("Priority:")
         self.priority_combo = QComboBox()
+        self.priority_combo.setObjectName("priorityCombo")
         self.priority_combo.addItems(["High", "Medium", "Low"])
-        self.priority_combo.setItemData(0, "#e74c3c", Qt.UserRole + 1)  # Red for High
-        self.priority_combo.setItemData(1, "#f39c12", Qt.UserRole + 1)  # Orange for Medium
-        self.priority_combo.setItemData(2, "#2ecc71", Qt.UserRole + 1)  # Green for Low
-        
-        # Update the style based on the selected priority
-        self.priority_combo.setStyleSheet("""
-            QComboBox {
-                padding-left: 10px;
-                height: 30px;
-            }
-        """)
         
         # Set current priority
         if self.task:
@@ -1818,35 +2583,14 @@ class TaskDialog(QDialog):
         color_layout = QHBoxLayout()
         
         self.color_preview = QPushButton()
+        self.color_preview.setObjectName("colorPreview")
         self.color_preview.setFixedSize(30, 30)
-        self.color_preview.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.task_color};
-                border: 1px solid #dcdfe6;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                border: 1px solid #3498db;
-            }}
-        """)
+        self.color_preview.setStyleSheet(f"background-color: {self.task_color};")
         self.color_preview.clicked.connect(self.selectColor)
         
         self.color_button = QPushButton("Choose Color")
+        self.color_button.setObjectName("chooseColorButton")
         self.color_button.setCursor(Qt.PointingHandCursor)
-        self.color_button.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 15px;
-                font-family: 'Segoe UI';
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
         self.color_button.clicked.connect(self.selectColor)
         
         color_layout.addWidget(self.color_preview)
@@ -1864,41 +2608,13 @@ class TaskDialog(QDialog):
         button_layout.setSpacing(15)
         
         self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setObjectName("cancelButton")
         self.cancel_btn.setCursor(Qt.PointingHandCursor)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ecf0f1;
-                color: #2c3e50;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-family: 'Segoe UI';
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #d6dbdf;
-            }
-        """)
         self.cancel_btn.clicked.connect(self.reject)
         
         self.save_btn = QPushButton("Save")
+        self.save_btn.setObjectName("saveButton")
         self.save_btn.setCursor(Qt.PointingHandCursor)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 10px 20px;
-                font-family: 'Segoe UI';
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-        """)
         self.save_btn.clicked.connect(self.accept)
         
         button_layout.addStretch()
@@ -1909,30 +2625,18 @@ class TaskDialog(QDialog):
     
     def updatePriorityStyle(self, index):
         """Update the combobox style based on the selected priority."""
-        color = self.priority_combo.itemData(index, Qt.UserRole + 1)
-        self.priority_combo.setStyleSheet(f"""
-            QComboBox {{
-                padding-left: 10px;
-                height: 30px;
-                border-left: 6px solid {color};
-            }}
-        """)
+        self.priority_combo.setProperty("priority", self.priority_combo.itemText(index))
+        self.priority_combo.style().unpolish(self.priority_combo)
+        self.priority_combo.style().polish(self.priority_combo)
     
     def selectColor(self):
         """Open a color dialog to select a task color."""
-        color = QColorDialog.getColor(initial=QColor(self.task_color))
-        if color.isValid():
+        color = QColorDialog.getColor(initial=self._task_qcolor)
+        # The preview is restyled once the dialog closes, and only for a new color
+        if color.isValid() and color.name() != self.task_color:
             self.task_color = color.name()
-            self.color_preview.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {self.task_color};
-                    border: 1px solid #dcdfe6;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    border: 1px solid #3498db;
-                }}
-            """)
+            self._task_qcolor = color
+            self.color_preview.setStyleSheet(f"background-color: {self.task_color};")
     
     def getTaskData(self):
         """Get the task data from the dialog."""
@@ -1942,22 +2646,3 @@ class TaskDialog(QDialog):
             "priority": self.priority_combo.currentText(),
             "color": self.task_color
         }
-
-
-class Task:
-    """Represents a task in the kanban board."""
-    
-    def __init__(self, id=None, name="", description="", status="todo", patient_id=None, 
-                 program_id=None, order_index=0, color="#ffffff", priority="Medium",
-                 version=1, modified_at=None):
-        self.id = id
-        self.name = name
-        self.description = description
-        self.status = status
-        self.patient_id = patient_id
-        self.program_id = program_id
-        self.order_index = order_index
-        self.color = color  # Background color for the task
-        self.priority = priority  # Priority level: "High", "Medium", "Low"
-        self.version = version  # For concurrent edit handling
-        self.modified_at = modified_at  # Last modification timestamp
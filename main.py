@@ -664,10 +664,13 @@ class MedicalPatientManager(QMainWindow):
                 widget.deleteLater()
         
         if programs:
+            # The boards show the patient in their header; look it up once for all of them
+            patient = self.db.get_patient_by_id(patient_id)
+            
             # Add tabs for each program
             for program in programs:
                 # Create Kanban board for this program
-                kanban = KanbanBoard(self.db, program.id, patient_id=patient_id)
+                kanban = KanbanBoard(self.db, program.id, patient_id=patient_id, program=program, patient=patient)
                 self.program_tabs.addTab(kanban, program.name)
         else:
             # No programs yet
@@ -836,7 +839,9 @@ class MedicalPatientManager(QMainWindow):
     def showPreferencesDialog(self):
         """Show the preferences dialog."""
         dialog = PreferencesDialog(self)
-        dialog.exec_()
+        if dialog.exec_():
+            # Boards opened from now on use the new settings
+            KanbanBoard.settingsChanged()
     
     def sharePatient(self):
         """Show the dialog to share patient access."""
@@ -29,8 +29,12 @@ class Program:
 
 class Task:
     """Model class for tasks within a program."""
-    
-    def __init__(self, name="", description="", status="To Do", program_id=None, patient_id=None, id=None, order_index=0, 
+
+    # Boards hold every task of a program; slots keep each instance small
+    __slots__ = ("id", "name", "description", "status", "program_id", "patient_id", "order_index",
+                 "created_at", "modified_at", "version", "color", "priority")
+
+    def __init__(self, name="", description="", status="To Do", program_id=None, patient_id=None, id=None, order_index=0,
                  created_at=None, modified_at=None, version=1, color="#ffffff", priority="Medium"):
         self.id = id
         self.name = name
@@ -49,6 +49,7 @@ def api_root():
             {"path": "/api/programs/<id>", "methods": ["GET", "PUT", "DELETE"], "description": "Retrieve, update, or delete a specific program"},
             {"path": "/api/shared_patients", "methods": ["GET"], "description": "Get patients shared with a specific user"},
             {"path": "/api/tasks", "methods": ["GET", "POST"], "description": "Retrieve or create tasks"},
+            {"path": "/api/tasks/revision", "methods": ["GET"], "description": "Get a fingerprint of a program's tasks that changes with any task change"},
             {"path": "/api/tasks/<task_id>", "methods": ["GET", "PUT", "DELETE"], "description": "Retrieve, update, or delete a specific task"},
             {"path": "/api/users/<int:user_id>", "methods": ["GET"], "description": "Get user information by ID"},
             {"path": "/api/users", "methods": ["GET"], "description": "Get all users"},
@@ -416,7 +417,10 @@ def get_tasks():
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM tasks WHERE program_id = ?", (program_id,))
+        cursor.execute(
+            "SELECT * FROM tasks WHERE program_id = ? ORDER BY status, order_index, created_at",
+            (program_id,)
+        )
         tasks = cursor.fetchall()
         
         return jsonify({'tasks': tasks}), 200
@@ -427,6 +431,32 @@ def get_tasks():
         if conn:
             conn.close()
 
+@app.route('/api/tasks/revision', methods=['GET'])
+def get_tasks_revision():
+    """Get a cheap fingerprint of a program's tasks, so clients can poll for changes"""
+    program_id = request.args.get('program_id')
+    
+    if not program_id:
+        return jsonify({'error': 'Missing program_id parameter'}), 400
+    
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            """SELECT COUNT(*) AS count, COALESCE(SUM(version), 0) AS versions, COALESCE(MAX(id), 0) AS max_id
+               FROM tasks WHERE program_id = ?""",
+            (program_id,)
+        )
+        row = cursor.fetchone()
+        
+        return jsonify({'revision': [row['count'], row['versions'], row['max_id']]}), 200
+    except Exception as e:
+        print(f"Error getting tasks revision: {e}")
+        return jsonify({'error': str(e)}), 500
+    finally:
+        if conn:
+            conn.close()
+
 @app.route('/api/tasks', methods=['POST'])
 def add_task():
     """Add a new task"""